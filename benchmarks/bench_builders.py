@@ -0,0 +1,308 @@
+"""
+Scaling benchmarks for every design builder in doepy.build.
+
+Each builder is timed and memory-profiled over a grid of factor counts and sample sizes, and the
+results are saved as JSON so that two releases can be compared:
+
+    python benchmarks/bench_builders.py run --output results.json [--quick] [--builders lhs halton]
+    python benchmarks/bench_builders.py compare baseline.json results.json [--threshold 1.25]
+
+Wall time is the best of --repeat runs, measured without tracing. Peak memory is measured in a
+separate run with tracemalloc, which also sees numpy allocations. It is the largest amount of memory
+allocated at once during the build.
+
+Builders whose size does not depend on the sample count (full_fact, frac_fact_res, plackett_burman,
+box_behnken, central_composite) run once per factor count. Combinations beyond the per-builder row
+and cell limits below are skipped, because the slower samplers would otherwise take hours.
+`compare` exits with status 1 if any common case got slower or used more memory than the threshold.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from doepy import build  # noqa: E402
+
+FACTOR_COUNTS = [2, 5, 10, 20, 50]
+SAMPLE_SIZES = [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6]
+
+QUICK_FACTOR_COUNTS = [2, 5, 10]
+QUICK_SAMPLE_SIZES = [10, 100, 1000]
+
+
+def _ranges(factor_count, levels=2):
+    return {
+        "x{}".format(i): list(np.linspace(0.0, 1.0, levels))
+        for i in range(factor_count)
+    }
+
+
+def _sukharev_rows(factor_count, num_samples):
+    # Same rounding up as the Sukharev builder
+    check = num_samples ** (1 / factor_count)
+    if check - int(check) > 1e-5:
+        return (int(check) + 1) ** factor_count
+    return num_samples
+
+
+# name: (callable(factor_count, num_samples), expected rows (or an upper bound),
+#        uses the sample size, max rows, max cells)
+BUILDERS = {
+    "full_fact": (
+        lambda k, n: build.full_fact(_ranges(k)),
+        lambda k, n: 2 ** k,
+        False,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "frac_fact_res": (
+        lambda k, n: build.frac_fact_res(_ranges(k), res=3),
+        lambda k, n: 0 if k <= 3 else 2 * k,  # upper bound for resolution III
+        False,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "plackett_burman": (
+        lambda k, n: build.plackett_burman(_ranges(k)),
+        lambda k, n: 4 * (k // 4 + 1),
+        False,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "sukharev": (
+        lambda k, n: build.sukharev(_ranges(k), num_samples=n),
+        _sukharev_rows,
+        True,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "box_behnken": (
+        lambda k, n: build.box_behnken(_ranges(k, levels=3)),
+        lambda k, n: 0 if k < 3 else 2 * k * (k - 1),
+        False,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "central_composite": (
+        lambda k, n: build.central_composite(_ranges(k)),
+        lambda k, n: 2 ** k + 2 * k,
+        False,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "lhs": (
+        lambda k, n: build.lhs(_ranges(k), num_samples=n),
+        lambda k, n: n,
+        True,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "lhs_maximin": (
+        lambda k, n: build.lhs(_ranges(k), num_samples=n, criterion="maximin"),
+        lambda k, n: n,
+        True,
+        2 * 10 ** 3,
+        6 * 10 ** 4,
+    ),
+    "space_filling_lhs": (
+        lambda k, n: build.space_filling_lhs(_ranges(k), num_samples=n),
+        lambda k, n: n,
+        True,
+        10 ** 5,
+        10 ** 6,
+    ),
+    "random_k_means": (
+        lambda k, n: build.random_k_means(_ranges(k), num_samples=n),
+        lambda k, n: n,
+        True,
+        10 ** 3,
+        5 * 10 ** 3,
+    ),
+    "maximin": (
+        lambda k, n: build.maximin(_ranges(k), num_samples=n),
+        lambda k, n: n,
+        True,
+        10 ** 3,
+        5 * 10 ** 3,
+    ),
+    "halton": (
+        lambda k, n: build.halton(_ranges(k), num_samples=n),
+        lambda k, n: n,
+        True,
+        10 ** 5,
+        10 ** 6,
+    ),
+    "sobol": (
+        lambda k, n: build.sobol(_ranges(k), num_samples=n, seed=0),
+        lambda k, n: n,
+        True,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "lattice": (
+        lambda k, n: build.lattice(_ranges(k), num_samples=n),
+        lambda k, n: n,
+        True,
+        10 ** 6,
+        10 ** 7,
+    ),
+    "uniform_random": (
+        lambda k, n: build.uniform_random(_ranges(k), num_samples=n),
+        lambda k, n: n,
+        True,
+        10 ** 6,
+        10 ** 7,
+    ),
+}
+
+
+def _cases(name, factor_counts, sample_sizes):
+    """
+    Yields the (factor count, sample size) combinations run for one builder.
+    """
+    _, expected_rows, uses_samples, max_rows, max_cells = BUILDERS[name]
+    for k in factor_counts:
+        for n in sample_sizes if uses_samples else [None]:
+            rows = expected_rows(k, n)
+            if 0 < rows <= max_rows and rows * k <= max_cells:
+                yield k, n
+
+
+def _quiet(func, *args):
+    # The builders print notes about adjusted levels and sample sizes
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def measure(name, factor_count, num_samples, repeat):
+    """
+    Returns the result record of one builder for one (factor count, sample size) case.
+    """
+    func = BUILDERS[name][0]
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = _quiet(func, factor_count, num_samples)
+        timings.append(time.perf_counter() - start)
+        rows = len(df)
+        del df
+
+    tracemalloc.start()
+    try:
+        _quiet(func, factor_count, num_samples)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "builder": name,
+        "factors": factor_count,
+        "samples": num_samples,
+        "rows": rows,
+        "time_min_s": min(timings),
+        "time_median_s": statistics.median(timings),
+        "peak_bytes": peak,
+    }
+
+
+def run(args):
+    factor_counts = QUICK_FACTOR_COUNTS if args.quick else FACTOR_COUNTS
+    sample_sizes = QUICK_SAMPLE_SIZES if args.quick else SAMPLE_SIZES
+
+    results = []
+    for name in args.builders or list(BUILDERS):
+        for k, n in _cases(name, factor_counts, sample_sizes):
+            record = measure(name, k, n, args.repeat)
+            results.append(record)
+            print(
+                "{builder:>18}  k={factors:<3} n={samples!s:<8} rows={rows:<8} "
+                "{time_min_s:9.4f} s  {peak_mb:9.2f} MB".format(
+                    peak_mb=record["peak_bytes"] / 2 ** 20, **record
+                ),
+                flush=True,
+            )
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=1)
+    print("Saved {} results to {}".format(len(results), args.output))
+    return 0
+
+
+def _key(record):
+    return record["builder"], record["factors"], record["samples"]
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = {_key(r): r for r in json.load(f)["results"]}
+    with open(args.current) as f:
+        current = {_key(r): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    for key in sorted(set(baseline) & set(current), key=str):
+        old, new = baseline[key], current[key]
+        time_ratio = new["time_min_s"] / max(old["time_min_s"], 1e-9)
+        memory_ratio = new["peak_bytes"] / max(old["peak_bytes"], 1)
+        flag = ""
+        if time_ratio > args.threshold or memory_ratio > args.threshold:
+            flag = "  <-- regression"
+            regressions += 1
+        print(
+            "{:>18}  k={:<3} n={!s:<8} time x{:6.2f}  memory x{:6.2f}{}".format(
+                key[0], key[1], key[2], time_ratio, memory_ratio, flag
+            )
+        )
+    print("{} regression(s) above x{}".format(regressions, args.threshold))
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for doepy.build")
+    commands = parser.add_subparsers(dest="command")
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", default="bench_builders.json")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--quick", action="store_true", help="small grid only")
+    run_parser.add_argument("--builders", nargs="+", choices=list(BUILDERS))
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=1.25)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return run(args)
+    if args.command == "compare":
+        return compare(args)
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Import-time budget for ``import doepy.build``.
+
+Each measurement runs in a fresh interpreter with ``python -X importtime``. numpy and pandas are
+imported first, so the reported figure is the cost of doepy itself and of anything it pulls in
+beyond the DataFrame stack. The sampling backends (pyDOE, diversipy) and SciPy must not be loaded
+at all: they are resolved lazily by the builders that need them.
+
+Usage (from the repository root):
+
+    python benchmarks/import_time.py [--repeat 7] [--budget-ms 50]
+
+Exits with status 1 if the median import time exceeds the budget or if a backend got imported.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Default budget for doepy's own import cost, in milliseconds
+IMPORT_BUDGET_MS = 50
+
+# Modules that "import doepy.build" must not load
+LAZY_BACKENDS = ("pyDOE", "diversipy", "scipy")
+
+SNIPPET = (
+    "import numpy, pandas, sys; import doepy.build; "
+    "print(','.join(m for m in {!r} if m in sys.modules))".format(LAZY_BACKENDS)
+)
+
+
+def measure_once():
+    """
+    Runs one fresh interpreter and returns (cumulative import time of doepy.build in ms, loaded backends).
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SNIPPET],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "doepy.build":
+            cumulative_us = int(fields[1])
+    loaded = [module for module in result.stdout.strip().split(",") if module]
+    return cumulative_us / 1000.0, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    timings = []
+    loaded = set()
+    for _ in range(args.repeat):
+        ms, backends = measure_once()
+        timings.append(ms)
+        loaded.update(backends)
+
+    median = statistics.median(timings)
+    print(
+        "import doepy.build: median {:.1f} ms, min {:.1f} ms over {} runs (budget {:.1f} ms)".format(
+            median, min(timings), len(timings), args.budget_ms
+        )
+    )
+    if loaded:
+        print("FAIL: eagerly imported " + ", ".join(sorted(loaded)))
+    if median > args.budget_ms:
+        print("FAIL: over the import-time budget")
+    return 1 if loaded or median > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+import importlib.util
+import os
+import warnings
+
+import pandas as pd
+import pytest
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "doepy")
+
+
+def _load_snapshot(module):
+    """
+    Module of the original package (the snapshot in doepy/Test/doepy), loaded under another name.
+    """
+    path = os.path.join(SNAPSHOT_DIR, module + ".py")
+    spec = importlib.util.spec_from_file_location("baseline_" + module, path)
+    snapshot = importlib.util.module_from_spec(spec)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        spec.loader.exec_module(snapshot)
+    return snapshot
+
+
+@pytest.fixture(scope="session")
+def baseline_pydoe():
+    return _load_snapshot("pydoe_corrected")
+
+
+@pytest.fixture(scope="session")
+def baseline_doe_functions():
+    """
+    doe_functions of the original package. Its construct_df assigns the levels through chained indexing,
+    which never writes under pandas copy-on-write, so it is replaced by the same cell-by-cell lookup
+    into the same float32 frame.
+    """
+    snapshot = _load_snapshot("doe_functions")
+
+    def construct_df(x, r):
+        df = pd.DataFrame(data=x, dtype="float32")
+        for i in df.index:
+            for j in range(df.shape[1]):
+                df.iloc[i, j] = r[j][int(df.iloc[i, j])]
+        return df
+
+    snapshot.construct_df = construct_df
+    return snapshot
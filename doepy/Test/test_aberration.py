@@ -0,0 +1,96 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from doepy import aberration
+from doepy.pydoe_corrected import fracfact_from_masks
+
+# 8-, 16- and 32-run designs. The 32-run ones are checked up to 20 factors, beyond which the
+# enumeration of the column subsets gets slow for a unit test.
+CASES = [
+    (n_base, int(n))
+    for n_base, limit in ((3, None), (4, None), (5, 20))
+    for n in aberration._load_table()[str(n_base)]
+    if limit is None or int(n) <= limit
+]
+
+
+def brute_force_pattern(H):
+    """
+    (A_3, ..., A_7) by enumerating the column subsets whose product is constant.
+    """
+    pattern = []
+    for length in range(3, aberration.MAX_WORD_LENGTH + 1):
+        subsets = np.array(list(combinations(range(H.shape[1]), length)), dtype=np.intp)
+        if not len(subsets):
+            pattern.append(0)
+            continue
+        products = H[:, subsets].prod(axis=2)
+        pattern.append(int((np.abs(products.sum(axis=0)) == len(H)).sum()))
+    return pattern
+
+
+@pytest.mark.parametrize("n_base, n", CASES)
+def test_table_pattern_matches_brute_force(n_base, n):
+    entry = aberration._load_table()[str(n_base)][str(n)]
+    masks = [1 << i for i in range(n_base)] + entry["masks"]
+    H = fracfact_from_masks(n_base, masks).astype(np.int8)
+    assert H.shape == (2 ** n_base, n)
+    assert brute_force_pattern(H) == entry["pattern"]
+    assert aberration.word_length_pattern(n_base, entry["masks"]) == entry["pattern"]
+
+
+def exhaustive_min_pattern(n_base, n):
+    """
+    Smallest (A_3, ..., A_7) over every choice of the added interaction columns.
+    """
+    interactions = np.array([v for v in range(1, 1 << n_base) if v & (v - 1)])
+    # XOR and size of every subset of the base columns
+    words, lengths = np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    for i in range(n_base):
+        words = np.concatenate([words, words ^ (1 << i)])
+        lengths = np.concatenate([lengths, lengths + 1])
+    choices = interactions[list(combinations(range(len(interactions)), n - n_base))]
+    x = np.repeat(words[np.newaxis], len(choices), axis=0)
+    length = np.repeat(lengths[np.newaxis], len(choices), axis=0)
+    for column in choices.T:
+        x = np.concatenate([x, x ^ column[:, np.newaxis]], axis=1)
+        length = np.concatenate([length, length + 1], axis=1)
+    patterns = np.stack(
+        [
+            ((x == 0) & (length == l)).sum(axis=1)
+            for l in range(3, aberration.MAX_WORD_LENGTH + 1)
+        ],
+        axis=1,
+    )
+    return min(map(list, patterns.tolist()))
+
+
+# All 8- and 16-run designs and the 32-run ones up to 9 factors (the enumeration grows quickly)
+@pytest.mark.parametrize(
+    "n_base, n", [(n_base, n) for n_base, n in CASES if n_base < 5 or n <= 9]
+)
+def test_table_is_minimum_aberration(n_base, n):
+    entry = aberration._load_table()[str(n_base)][str(n)]
+    assert entry["pattern"] == exhaustive_min_pattern(n_base, n)
+
+
+@pytest.mark.parametrize(
+    "n, res, runs", [(5, 3, 8), (6, 4, 16), (8, 4, 16), (9, 4, 32), (8, 5, 64)]
+)
+def test_fewest_runs_for_resolution(n, res, runs):
+    H = aberration.fracfact_min_aberration(n, res)
+    assert H.shape == (runs, n)
+    assert aberration.pattern_resolution(brute_force_pattern(H.astype(np.int8))) >= res
+
+
+def test_known_minimum_aberration_designs():
+    # 2^(7-2) and 2^(6-2) minimum-aberration designs (Chen, Sun and Wu, 1993)
+    assert aberration._load_table()["5"]["7"]["pattern"][:2] == [0, 1]
+    assert aberration._load_table()["4"]["6"]["pattern"][:2] == [0, 3]
+
+
+def test_impossible_resolution():
+    with pytest.raises(ValueError):
+        aberration.min_aberration_masks(4, aberration.MAX_WORD_LENGTH + 2)
@@ -0,0 +1,68 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from doepy import build
+
+DICTS = [
+    {"Pressure": [50, 60, 70], "Temperature": [290, 320, 350], "Flow": [0.9, 1.0]},
+    {"Pressure": [1, 2, 3], "Temperature": [-5, 0, 5], "Flow": [10, 20]},
+    {"Pressure": [1, 2], "Temperature": [7, 8, 9, 10], "Flow": [0.5, 0.75, 1.0]},
+]
+
+
+def dicts():
+    # The builders reshape the level lists of their argument in place
+    return copy.deepcopy(DICTS)
+
+
+@pytest.mark.parametrize(
+    "kind, params",
+    [
+        ("full_fact", {}),
+        ("frac_fact_res", {"res": 2}),
+        ("plackett_burman", {}),
+        ("box_behnken", {"center": 2}),
+        ("central_composite", {"center": (1, 1), "face": "ccf"}),
+        ("sukharev", {"num_samples": 8}),
+        ("halton", {"num_samples": 10, "start": 3}),
+    ],
+)
+@pytest.mark.parametrize("dtype", [None, "float32"])
+def test_batch_matches_the_builds(kind, params, dtype):
+    frames = build.batch(kind, dicts(), dtype=dtype, **params)
+    builder = getattr(build, kind)
+    assert len(frames) == len(DICTS)
+    for frame, d in zip(frames, dicts()):
+        pd.testing.assert_frame_equal(frame, builder(d, dtype=dtype, **params))
+
+
+def test_long_format():
+    df = build.batch("full_fact", dicts()[:2], long_format=True)
+    assert df.index.names == ["batch", "run"]
+    pd.testing.assert_frame_equal(
+        df.loc[1], build.full_fact(dicts()[1]), check_names=False
+    )
+
+
+def test_randomized_designs_draw_per_dictionary():
+    same = [copy.deepcopy(DICTS[0]) for _ in range(3)]
+    frames = build.batch("lhs", same, num_samples=6)
+    assert not frames[0].equals(frames[1])
+    assert all(frame.shape == (6, 3) for frame in frames)
+
+
+def test_builder_only_arguments():
+    frames = build.batch("full_fact", dicts(), output="codes")
+    for frame, d in zip(frames, dicts()):
+        pd.testing.assert_frame_equal(frame, build.full_fact(d, output="codes"))
+        assert frame.attrs["levels"] == d
+
+
+def test_unknown_kind_and_arguments():
+    with pytest.raises(ValueError, match="kind must be one of"):
+        build.batch("taguchi", dicts())
+    with pytest.raises(ValueError, match="takes no argument 'num_samples'"):
+        build.batch("full_fact", dicts(), num_samples=4)
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from doepy import build
+from doepy import pydoe_corrected as pc
+
+
+@pytest.mark.parametrize("n", [3, 4, 5, 6, 7, 9])
+@pytest.mark.parametrize("center", [None, 1, 3])
+def test_bbdesign_matches_baseline(baseline_pydoe, n, center):
+    np.testing.assert_array_equal(
+        pc.bbdesign_corrected(n, center=center),
+        baseline_pydoe.bbdesign_corrected(n, center=center),
+    )
+
+
+@pytest.mark.parametrize("n", sorted(pc.BIBD_BLOCKS))
+def test_bibd_blocks_cover_every_pair(n):
+    H = pc.bbdesign_corrected(n, blocks="bibd", center=0)
+    assert len(H) == 8 * len(pc.BIBD_BLOCKS[n])
+    # Every pair of factors is varied together in some run
+    varied = H != 0
+    assert ((varied.T.astype(int) @ varied.astype(int)) > 0).all()
+
+
+def test_blocks_given_as_an_array():
+    factors = {"x{}".format(i): [0, 5, 10] for i in range(7)}
+    expected = build.box_behnken(dict(factors), blocks=pc.BIBD_BLOCKS[7])
+    df = build.box_behnken(dict(factors), blocks=np.array(pc.BIBD_BLOCKS[7]))
+    assert len(df) == 8 * len(pc.BIBD_BLOCKS[7]) + 1
+    pd.testing.assert_frame_equal(df, expected)
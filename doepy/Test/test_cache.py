@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from doepy import build
+from doepy.cache import DesignCache, design_cache
+from doepy.pydoe_corrected import (
+    BIBD_BLOCKS,
+    bbdesign_corrected,
+    fracfact_by_res,
+)
+
+
+def test_cached_arrays_are_read_only():
+    cache = DesignCache()
+    x = cache.call(fracfact_by_res, 5, 3)
+    assert not x.flags.writeable
+    with pytest.raises(ValueError):
+        x[0, 0] = 0
+    assert cache.call(fracfact_by_res, 5, 3) is x
+
+
+def test_builds_do_not_write_into_the_cache():
+    factors = {"A": [1, 2], "B": [3, 4], "C": [5, 6], "D": [7, 8], "E": [9, 10]}
+    first = build.frac_fact_res(dict(factors), res=3)
+    first.iloc[:, :] = 0
+    np.testing.assert_array_equal(
+        build.frac_fact_res(dict(factors), res=3).values,
+        (fracfact_by_res(5, 3) > 0) + np.array([1, 3, 5, 7, 9]),
+    )
+
+
+def test_lru_eviction_and_stats():
+    cache = DesignCache(max_entries=2)
+    cache.call(fracfact_by_res, 4, 3)
+    cache.call(fracfact_by_res, 5, 3)
+    cache.call(fracfact_by_res, 4, 3)  # (4, 3) is now the most recently used
+    cache.call(fracfact_by_res, 6, 3)  # evicts (5, 3)
+    cache.call(fracfact_by_res, 4, 3)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1)
+    assert stats["entries"] == 2
+
+    cache.call(fracfact_by_res, 5, 3)
+    assert cache.stats()["misses"] == 4
+
+
+def test_byte_limit():
+    cache = DesignCache(max_bytes=fracfact_by_res(8, 4).nbytes)
+    cache.call(fracfact_by_res, 8, 4)
+    cache.call(fracfact_by_res, 6, 3)
+    stats = cache.stats()
+    assert stats["entries"] == 1 and stats["bytes"] <= stats["max_bytes"]
+
+    cache.configure(max_entries=0)
+    assert cache.stats()["entries"] == 0
+
+
+def test_arguments_are_keyed_by_value():
+    cache = DesignCache()
+    blocks = [list(block) for block in BIBD_BLOCKS[7]]
+    a = cache.call(bbdesign_corrected, 7, 1, blocks)
+    b = cache.call(bbdesign_corrected, 7, 1, tuple(map(tuple, blocks)))
+    c = cache.call(bbdesign_corrected, 7, 1, np.array(blocks))
+    assert a is b
+    np.testing.assert_array_equal(a, c)
+    assert cache.stats()["misses"] == 2
+
+
+def test_disk_tier_round_trip(tmp_path):
+    writer = DesignCache(directory=str(tmp_path))
+    x = writer.call(fracfact_by_res, 7, 4)
+    assert len(list(tmp_path.glob("fracfact_by_res_*.npy"))) == 1
+
+    # A new cache (e.g. in another process) reads the matrix back from disk
+    reader = DesignCache(directory=str(tmp_path))
+    y = reader.call(fracfact_by_res, 7, 4)
+    np.testing.assert_array_equal(y, x)
+    assert not y.flags.writeable
+    assert reader.stats()["disk_hits"] == 1 and reader.stats()["misses"] == 0
+
+
+def test_global_cache_serves_repeated_builds():
+    factors = {"A": [0, 1], "B": [0, 1], "C": [0, 1], "D": [0, 1]}
+    build.frac_fact_res(dict(factors), res=3)
+    hits = design_cache.stats()["hits"]
+    build.frac_fact_res({k: [10, 20] for k in factors}, res=3)
+    assert design_cache.stats()["hits"] == hits + 1
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from doepy import build
+
+
+def factors():
+    return {
+        "Pressure": [50, 60, 70],
+        "Temperature": [290, 320, 350, 380],
+        "Flow rate": [0.9, 1.0],
+    }
+
+
+@pytest.fixture
+def lazy():
+    return build.lazy_full_fact(factors())
+
+
+@pytest.fixture
+def full():
+    return build.full_fact(factors())
+
+
+def test_lazy_full_factorial_size(lazy):
+    assert len(lazy) == 24
+    assert lazy.to_frame().shape == (24, 3)
+
+
+@pytest.mark.parametrize("i", [0, 1, 7, 23, -1, -24])
+def test_single_runs(lazy, full, i):
+    run = lazy[i]
+    pd.testing.assert_series_equal(run, full.iloc[i], check_names=False)
+    assert run.name == i % 24
+
+
+@pytest.mark.parametrize(
+    "key", [slice(None), slice(5, 17), slice(3, None, 4), slice(None, None, -5)]
+)
+def test_slices(lazy, full, key):
+    pd.testing.assert_frame_equal(lazy[key], full.iloc[key], check_index_type=False)
+
+
+def test_fancy_indexing(lazy, full):
+    pd.testing.assert_frame_equal(
+        lazy[[3, 0, -1]], full.iloc[[3, 0, 23]], check_index_type=False,
+    )
+
+
+def test_out_of_range(lazy):
+    with pytest.raises(IndexError):
+        lazy[24]
+    with pytest.raises(IndexError):
+        lazy[[0, 24]]
+
+
+@pytest.mark.parametrize("as_array", [False, True])
+def test_chunks(lazy, full, as_array):
+    chunks = list(lazy.iter_chunks(chunk_rows=5, start=2, stop=21, as_array=as_array))
+    assert [len(chunk) for chunk in chunks] == [5, 5, 5, 4]
+    values = np.concatenate([np.asarray(chunk) for chunk in chunks])
+    np.testing.assert_array_equal(values, full.values[2:21])
+
+
+def test_narrow_dtype():
+    lazy = build.lazy_full_fact({"A": [1, 2, 3], "B": [-5, 5]}, dtype="narrow")
+    assert lazy[:].dtypes.tolist() == [np.dtype(np.int8)] * 2
+    assert lazy[4].dtype == np.int8
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from doepy import build
+from doepy.distributions import DistributionStage
+
+stats = pytest.importorskip("scipy.stats")
+
+LOW, HIGH = 2.0, 8.0
+U = np.linspace(0.0005, 0.9995, 41)[:, np.newaxis]
+
+# Frozen scipy.stats distribution expected for each spec on the range [LOW, HIGH]
+CASES = [
+    (None, stats.uniform(loc=LOW, scale=HIGH - LOW)),
+    ("uniform", stats.uniform(loc=LOW, scale=HIGH - LOW)),
+    ("normal", stats.norm(loc=5, scale=1)),
+    (("normal", {"mean": 6, "std": 0.5}), stats.norm(loc=6, scale=0.5)),
+    ("truncnorm", stats.truncnorm(-3, 3, loc=5, scale=1)),
+    ("lognormal", stats.lognorm(s=np.log(HIGH / LOW) / 6, scale=np.sqrt(LOW * HIGH)),),
+    ("triangular", stats.triang(0.5, loc=LOW, scale=HIGH - LOW)),
+    (("triangular", {"mode": 3.5}), stats.triang(0.25, loc=LOW, scale=HIGH - LOW)),
+    ("beta", stats.beta(2, 2, loc=LOW, scale=HIGH - LOW)),
+    ("exponential", stats.expon(loc=LOW, scale=(HIGH - LOW) / stats.expon.ppf(0.999))),
+    ("gamma", stats.gamma(2, loc=LOW, scale=(HIGH - LOW) / stats.gamma.ppf(0.999, 2)),),
+    (("gamma", {"a": 3, "scale": 0.5}), stats.gamma(3, loc=LOW, scale=0.5)),
+    (("poisson", {"mu": 4}), stats.poisson(4, loc=LOW)),
+    (("weibull_min", {"c": 1.5}), stats.weibull_min(1.5, loc=LOW)),
+]
+
+
+@pytest.mark.parametrize("spec, expected", CASES)
+def test_stage_matches_scipy_ppf(spec, expected):
+    stage = DistributionStage(spec, ["x"], [[LOW, HIGH]])
+    np.testing.assert_allclose(stage(U)[:, 0], expected.ppf(U[:, 0]), rtol=1e-12)
+
+
+@pytest.mark.parametrize("name", ["exponential", "gamma"])
+def test_range_ends_at_the_top_quantile(name):
+    stage = DistributionStage(name, ["x"], [[LOW, HIGH]])
+    np.testing.assert_allclose(stage(np.array([[0.0], [0.999]]))[:, 0], [LOW, HIGH])
+
+
+def test_empirical_quantiles():
+    data = np.random.default_rng(1).normal(size=50)
+    stage = DistributionStage(("empirical", {"data": data}), ["x"], [[0, 1]])
+    np.testing.assert_allclose(stage(U)[:, 0], np.quantile(data, U[:, 0]))
+
+
+def test_columns_of_a_group_keep_their_own_parameters():
+    prob = {"a": "normal", "c": ("poisson", {"mu": 2}), "d": "normal"}
+    bounds = [[0, 6], [10, 20], [0, 1], [60, 66]]
+    out = DistributionStage(prob, "abcd", bounds)(np.tile(U, 4), dtype="float32")
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out[:, 0], stats.norm(3, 1).ppf(U[:, 0]), rtol=1e-6)
+    np.testing.assert_allclose(out[:, 1], 10 + 10 * U[:, 0], rtol=1e-6)
+    np.testing.assert_allclose(out[:, 2], stats.poisson(2).ppf(U[:, 0]))
+    np.testing.assert_allclose(out[:, 3], stats.norm(63, 1).ppf(U[:, 0]), rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "spec, message",
+    [
+        ("poisson", "poisson factors need the shape parameters mu"),
+        ("weibull_min", "shape parameters c"),
+        ("cauchy_like", "Unknown probability distribution"),
+        ("empirical", "'data' sample"),
+    ],
+)
+def test_missing_parameters(spec, message):
+    with pytest.raises(ValueError, match=message):
+        DistributionStage(spec, ["x"], [[LOW, HIGH]])
+
+
+def test_invalid_ranges_and_factors():
+    with pytest.raises(ValueError, match="positive range"):
+        DistributionStage("lognormal", ["x"], [[-1, 1]])
+    with pytest.raises(ValueError, match="unknown factors: y"):
+        DistributionStage({"y": "normal"}, ["x"], [[LOW, HIGH]])
+
+
+def test_lhs_prob_distribution():
+    d = {"Pressure": [40, 60], "Temperature": [290, 350]}
+    df = build.lhs(d, num_samples=200, prob_distribution={"Pressure": "normal"})
+    assert abs(df["Pressure"].mean() - 50) < 1
+    assert df["Temperature"].between(290, 350).all()
+    # One point per stratum of the normal distribution
+    strata = np.floor(stats.norm(50, 20 / 6).cdf(df["Pressure"]) * 200)
+    np.testing.assert_array_equal(np.sort(strata), np.arange(200))
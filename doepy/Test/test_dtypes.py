@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from doepy import build
+from doepy.doe_functions import resolve_dtype
+
+
+@pytest.mark.parametrize(
+    "levels, dtype",
+    [
+        ([[-1, 0, 1]], np.int8),
+        ([[290, 320, 350]], np.uint16),
+        ([[0, 70000]], np.uint32),
+        ([[-200, 5]], np.int16),
+        ([[0.5, 0.75]], np.float32),
+        ([[0.9, 1.0]], np.float64),
+        ([[1, 2], [0.5, 1.5]], np.float32),
+        ([[True, False]], np.bool_),
+    ],
+)
+def test_narrow_dtype(levels, dtype):
+    assert resolve_dtype("narrow", levels) == dtype
+
+
+def test_dtype_policy():
+    assert resolve_dtype() == np.float64
+    assert resolve_dtype("narrow") == np.float64  # computed values
+    assert resolve_dtype("float32", [[1, 2]]) == np.float32
+    with pytest.raises(ValueError):
+        resolve_dtype("narrow", [["Pt", "Pd"]])
+
+
+def factors():
+    return {
+        "Pressure": [50, 60, 70],
+        "Temperature": [290, 320, 350],
+        "Flow": [0.9, 1.0],
+    }
+
+
+@pytest.mark.parametrize(
+    "name, options",
+    [
+        ("full_fact", {}),
+        ("frac_fact_res", {}),
+        ("plackett_burman", {}),
+        ("box_behnken", {}),
+        ("central_composite", {}),
+        ("lhs", {"num_samples": 5}),
+        ("halton", {"num_samples": 5}),
+        ("uniform_random", {"num_samples": 5}),
+    ],
+)
+def test_float64_default_and_explicit_dtype(name, options):
+    df = getattr(build, name)(factors(), **options)
+    assert (df.dtypes == np.float64).all()
+    assert (df.dtypes.index == list(factors())).all()
+    small = getattr(build, name)(factors(), dtype="float32", **options)
+    assert (small.dtypes == np.float32).all()
+
+
+def test_narrow_builds_hold_the_levels_exactly():
+    integer = {"Pressure": [50, 60, 70], "Temperature": [290, 320, 350]}
+    df = build.full_fact(integer, dtype="narrow")
+    assert (df.dtypes == np.uint16).all()
+    assert df["Pressure"].tolist() == [50, 60, 70] * 3
+
+    df = build.full_fact(factors(), dtype="narrow")
+    assert (df.dtypes == np.float64).all()
+    assert set(df["Flow"]) == {0.9, 1.0}
+
+
+def test_frames_wrap_the_mapped_array():
+    df = build.full_fact(factors())
+    block = df.values
+    assert block.flags.f_contiguous and np.shares_memory(block, df["Pressure"].values)
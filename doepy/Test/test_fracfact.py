@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from doepy import pydoe_corrected as pc
+
+
+@pytest.mark.parametrize(
+    "gen",
+    [
+        "a b ab",
+        "a b c ab ac bc abc",
+        "a b -c ab",
+        "a b c d abc -abd acd",
+        "a b c d e abcde",
+    ],
+)
+def test_fracfact_corrected_matches_baseline(baseline_pydoe, gen):
+    np.testing.assert_array_equal(
+        pc.fracfact_corrected(gen), baseline_pydoe.fracfact_corrected(gen)
+    )
+
+
+@pytest.mark.parametrize(
+    "n, res",
+    [
+        (3, 2),
+        (5, 2),
+        (7, 2),
+        (4, 3),
+        (5, 3),
+        (6, 4),
+        (7, 4),
+        (8, 5),
+        (10, 4),
+        (12, 3),
+        (15, 6),
+    ],
+)
+def test_fracfact_by_res_matches_baseline(baseline_pydoe, n, res):
+    np.testing.assert_array_equal(
+        pc.fracfact_by_res(n, res), baseline_pydoe.fracfact_by_res(n, res)
+    )
+
+
+@pytest.mark.parametrize("n, res", [(4, 3), (7, 3), (8, 4), (10, 5), (20, 3)])
+def test_masks_match_string_generators(n, res):
+    n_base, masks = pc.masks_by_res(n, res)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    gen = " ".join(
+        "".join(letters[i] for i in range(n_base) if mask >> i & 1) for mask in masks
+    )
+    np.testing.assert_array_equal(
+        pc.fracfact_from_masks(n_base, masks), pc.fracfact_corrected(gen)
+    )
+
+
+def test_masks_give_the_products_of_the_base_factors():
+    # Base factors a, b, c and the added factors ab, ac, bc, abc
+    H = pc.fracfact_from_masks(3, [1, 2, 4, 3, 5, 6, 7])
+    full = pc.fracfact_corrected("a b c")
+    np.testing.assert_array_equal(H[:, :3], full)
+    np.testing.assert_array_equal(H[:, 3], full[:, 0] * full[:, 1])
+    np.testing.assert_array_equal(H[:, 6], full.prod(axis=1))
+    np.testing.assert_array_equal(H.T @ H, 8 * np.eye(7))
@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+
+from doepy import pydoe_corrected as pc
+
+
+@pytest.mark.parametrize("levels", [[2, 3], [3, 2, 4], [2] * 5, [1, 3], [7]])
+def test_fullfact_matches_baseline(baseline_pydoe, levels):
+    expected = baseline_pydoe.fullfact_corrected(levels)
+    np.testing.assert_array_equal(pc.fullfact_corrected(levels), expected)
+    assert pc.fullfact_corrected(levels).dtype == expected.dtype
+
+
+@pytest.mark.parametrize("levels, dtype", [([2, 3], np.uint8), ([300, 2], np.uint16)])
+def test_integer_codes(levels, dtype):
+    codes = pc.fullfact_corrected(levels, integer=True)
+    assert codes.dtype == dtype
+    np.testing.assert_array_equal(codes, pc.fullfact_corrected(levels))
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import doepy
+from doepy import pydoe_corrected as pc
+
+# Folder holding the doepy package, the working directory of the fresh interpreters
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(doepy.__file__)))
+
+
+def test_import_does_not_load_the_backends():
+    code = (
+        "import sys, doepy.build; "
+        "print(sorted(m for m in ('pyDOE', 'diversipy', 'scipy') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_reexported_names_resolve_lazily():
+    assert doepy.fullfact_corrected is pc.fullfact_corrected
+    assert callable(doepy.pbdesign)
+
+
+@pytest.mark.parametrize("n", [2, 3, 5])
+@pytest.mark.parametrize("face", ["circumscribed", "inscribed", "faced"])
+@pytest.mark.parametrize("alpha", ["orthogonal", "rotatable"])
+def test_ccdesign_matches_baseline(baseline_pydoe, n, face, alpha):
+    np.testing.assert_allclose(
+        pc.ccdesign_corrected(n, alpha=alpha, face=face),
+        baseline_pydoe.ccdesign_corrected(n, alpha=alpha, face=face),
+    )
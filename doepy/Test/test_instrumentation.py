@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from doepy import build
+from doepy.instrumentation import (
+    PHASES,
+    add_listener,
+    phase,
+    profile_phases,
+    remove_listener,
+)
+
+
+def factors():
+    return {
+        "Pressure": [50, 60, 70],
+        "Temperature": [290, 320, 350],
+        "Flow": [0.9, 1.0],
+    }
+
+
+def test_build_phases():
+    with profile_phases(memory=False) as records:
+        df = build.full_fact(factors())
+    assert [(r.builder, r.phase) for r in records] == [
+        ("build_full_fact", "normalize"),
+        ("build_full_fact", "generate"),
+        ("build_full_fact", "map"),
+        ("build_full_fact", "frame"),
+    ]
+    assert records[-1].shape == df.shape
+    assert all(r.seconds >= 0 and r.peak_bytes is None for r in records)
+
+
+def test_normalize_phase_and_memory():
+    with profile_phases() as records:
+        build.box_behnken(factors())
+    assert [r.phase for r in records] == ["normalize", "generate", "map", "frame"]
+    assert all(r.builder == "build_box_behnken" for r in records)
+    assert all(r.peak_bytes is not None for r in records)
+
+
+def test_streaming_build_phases():
+    with profile_phases(memory=False) as records:
+        chunks = list(build.iter_full_fact(factors(), chunk_rows=5))
+    assert {r.builder for r in records} == {"iter_build_full_fact"}
+    chunk_records = [r for r in records if r.phase == "frame"]
+    assert [r.shape for r in chunk_records] == [chunk.shape for chunk in chunks]
+
+
+def test_lazy_full_factorial_phases():
+    design = build.lazy_full_fact(factors())
+    with profile_phases(memory=False) as records:
+        design[2:9]
+    assert [(r.builder, r.phase, r.shape) for r in records] == [
+        ("FullFactorialDesign", "generate", (7, 3)),
+        ("FullFactorialDesign", "map", (7, 3)),
+        ("FullFactorialDesign", "frame", (7, 3)),
+    ]
+
+
+def test_listeners():
+    seen = []
+    add_listener(seen.append)
+    try:
+        build.lhs(factors(), num_samples=4)
+    finally:
+        remove_listener(seen.append)
+    assert {r.phase for r in seen} <= set(PHASES) and seen
+
+    count = len(seen)
+    build.lhs(factors(), num_samples=4)
+    assert len(seen) == count
+    with pytest.raises(ValueError):
+        remove_listener(seen.append)
+
+
+def test_no_listener_no_record():
+    with phase("map") as p:
+        p.set_shape((2, 2))
+    assert p.record is None
+
+
+def test_failed_phase_is_not_reported():
+    with profile_phases(memory=False) as records:
+        with pytest.raises(ZeroDivisionError):
+            with phase("generate"):
+                1 / 0
+    assert records == []
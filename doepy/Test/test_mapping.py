@@ -0,0 +1,82 @@
+import copy
+import os
+
+import numpy as np
+import pytest
+
+from doepy import build, read_write
+from doepy.doe_functions import lookup_levels, scale_coded_matrix, scale_unit_matrix
+
+PARAMS_CSV = os.path.join(os.path.dirname(__file__), "..", "Data", "params.csv")
+
+
+@pytest.fixture
+def params():
+    # The builders reshape the level lists of their argument in place
+    d = read_write.read_variables_csv(PARAMS_CSV)
+    return lambda: copy.deepcopy(d)
+
+
+@pytest.mark.parametrize(
+    "name", ["full_fact", "frac_fact_res", "plackett_burman", "box_behnken"]
+)
+def test_level_lookup_matches_baseline(baseline_doe_functions, params, name):
+    expected = getattr(baseline_doe_functions, "build_" + name)(params())
+    # The original frames were float32, the default is now float64 and holds the levels exactly
+    df = getattr(build, name)(params(), dtype="float32")
+    assert list(df.columns) == list(expected.columns)
+    np.testing.assert_array_equal(df.values, expected.values)
+    assert df.values.dtype == expected.values.dtype
+    np.testing.assert_array_equal(
+        getattr(build, name)(params()).values.astype(np.float32), expected.values
+    )
+
+
+def test_lookup_levels():
+    x = np.array([[0, 2], [1, 0], [1, 1]])
+    r = [[0.9, 1.1], [290, 320, 350]]
+    out = lookup_levels(x, r)
+    np.testing.assert_array_equal(out, [[0.9, 350], [1.1, 290], [1.1, 320]])
+    assert out.flags.f_contiguous
+
+
+@pytest.mark.parametrize(
+    "name, options",
+    [
+        ("central_composite", {}),
+        ("central_composite", {"face": "cci"}),
+        ("central_composite", {"face": "ccf", "alpha": "r"}),
+        ("sukharev", {"num_samples": 16}),
+        ("halton", {"num_samples": 30}),
+    ],
+)
+def test_scaling_matches_baseline(baseline_doe_functions, params, name, options):
+    expected = getattr(baseline_doe_functions, "build_" + name)(params(), **options)
+    df = getattr(build, name)(params(), **options)
+    np.testing.assert_array_equal(df.values, expected.values)
+
+
+@pytest.mark.parametrize("name", ["lhs", "space_filling_lhs", "uniform_random"])
+def test_random_scaling_matches_baseline(baseline_doe_functions, params, name):
+    np.random.seed(3)
+    expected = getattr(baseline_doe_functions, "build_" + name)(
+        params(), num_samples=12
+    )
+    np.random.seed(3)
+    df = getattr(build, name)(params(), num_samples=12)
+    np.testing.assert_array_equal(df.values, expected.values)
+
+
+def test_scale_coded_matrix_extrapolates_star_points():
+    x = np.array([[-2.0, -1.0, 0.0, 1.0, 1.5]]).T
+    out = scale_coded_matrix(x, [[10, 20]])
+    np.testing.assert_array_equal(out.ravel(), [5, 10, 15, 20, 22.5])
+    out = scale_coded_matrix(x, [[10, 12, 20]])
+    assert out[2, 0] == 12
+
+
+def test_scale_unit_matrix():
+    x = np.array([[0.0, 0.5], [1.0, 0.25]])
+    out = scale_unit_matrix(x, [[10, 20], [-1, 1]], dtype="float32")
+    np.testing.assert_array_equal(out, [[10, 0], [20, -0.5]])
+    assert out.dtype == np.float32
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from doepy import build
+from doepy.optimal_lhs import _Correlation, _PhiP, optimized_lhs
+
+
+def phi_p(x, p=50):
+    d = np.sqrt(((x[:, np.newaxis] - x[np.newaxis]) ** 2).sum(axis=2))
+    return (d[np.triu_indices(len(x), 1)] ** -p).sum() ** (1.0 / p)
+
+
+def correlation(x):
+    corr = np.corrcoef(x.T)
+    return (np.triu(corr, 1) ** 2).sum()
+
+
+def initial_design(n, samples, seed):
+    # The random Latin hypercube the optimization starts from
+    rng = np.random.default_rng(seed)
+    return (np.argsort(rng.random((samples, n)), axis=0) + 0.5) / samples
+
+
+def assert_latin(x):
+    samples = len(x)
+    for column in x.T:
+        np.testing.assert_array_equal(
+            np.sort(column), (np.arange(samples) + 0.5) / samples
+        )
+
+
+@pytest.mark.parametrize(
+    "criterion, measure", [("maximin", phi_p), ("correlation", correlation)]
+)
+def test_optimization_keeps_the_latin_property_and_improves(criterion, measure):
+    x = optimized_lhs(5, 30, criterion=criterion, iterations=3, seed=11)
+    assert x.shape == (30, 5)
+    assert_latin(x)
+    assert measure(x) < measure(initial_design(5, 30, seed=11))
+
+
+def test_seed_makes_the_design_reproducible():
+    a = optimized_lhs(3, 12, iterations=2, seed=4)
+    np.testing.assert_array_equal(a, optimized_lhs(3, 12, iterations=2, seed=4))
+    assert not np.array_equal(a, optimized_lhs(3, 12, iterations=2, seed=5))
+
+
+@pytest.mark.parametrize("state_type", [_PhiP, _Correlation])
+def test_incremental_updates_match_a_recomputation(state_type):
+    rng = np.random.default_rng(0)
+    levels = np.argsort(rng.random((9, 4)), axis=0)
+    state = state_type(levels)
+    for step in range(20):
+        column = step % 4
+        a = rng.integers(9, size=5)
+        b = (a + rng.integers(1, 9, size=5)) % 9
+        deltas = state.evaluate(levels, column, a, b)
+        state.apply(levels, column, a[0], b[0], deltas[0])
+        levels[[a[0], b[0]], column] = levels[[b[0], a[0]], column]
+        assert state.total == pytest.approx(state_type(levels).total, rel=1e-9)
+
+
+def test_small_designs_and_errors():
+    assert_latin(optimized_lhs(2, 2, seed=0))
+    with pytest.raises(ValueError):
+        optimized_lhs(2, 5, criterion="minimax")
+
+
+def test_lhs_builder_criterion():
+    d = {"Pressure": [40, 50], "Temperature": [290, 350]}
+    df = build.lhs(d, num_samples=8, criterion="maximin")
+    cells = np.floor((df.values - [40, 290]) / [10 / 8, 60 / 8])
+    for column in cells.T:
+        np.testing.assert_array_equal(np.sort(column), np.arange(8))
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from doepy import build
+
+
+# The builders complete or trim the level lists of their argument in place, so every build gets a fresh dictionary
+def factors():
+    return {"Catalyst": ["Pt", "Pd", "Rh"], "Temperature": [290, 320]}
+
+
+def numeric():
+    return {
+        "Pressure": [50, 60, 70],
+        "Temperature": [290, 320, 350],
+        "Flow": [0.9, 1.0],
+    }
+
+
+@pytest.mark.parametrize(
+    "builder", [build.full_fact, build.frac_fact_res, build.plackett_burman]
+)
+def test_categorical_and_codes_expand_to_the_values(builder):
+    values = builder(numeric())
+    categorical = builder(numeric(), output="categorical")
+    codes = builder(numeric(), output="codes")
+
+    assert (categorical.dtypes == "category").all()
+    pd.testing.assert_frame_equal(
+        categorical.astype(float), values, check_column_type=False
+    )
+    assert list(codes.attrs["levels"]) == list(values.columns)
+    for column, levels in codes.attrs["levels"].items():
+        assert codes[column].dtype == np.uint8
+        np.testing.assert_array_equal(
+            np.asarray(levels, dtype=float)[codes[column]], values[column]
+        )
+
+
+def test_non_numeric_levels():
+    categorical = build.full_fact(factors(), output="categorical")
+    codes = build.full_fact(factors(), output="codes")
+    assert list(categorical["Catalyst"][:3]) == ["Pt", "Pd", "Rh"]
+    assert list(categorical["Catalyst"].cat.categories) == ["Pt", "Pd", "Rh"]
+    assert codes.attrs["levels"] == factors()
+    assert list(codes["Catalyst"]) == [0, 1, 2, 0, 1, 2]
+
+
+def test_long_level_lists_use_uint16():
+    codes = build.full_fact({"A": list(range(300)), "B": [0, 1]}, output="codes")
+    assert (codes.dtypes == np.uint16).all()
+
+
+def test_unknown_output():
+    with pytest.raises(ValueError):
+        build.full_fact(numeric(), output="labels")
+
+
+def test_box_behnken_non_numeric_levels():
+    factors = {"Catalyst": ["Pt", "Pd", "Rh"], "B": [1, 3], "C": [0, 10]}
+    df = build.box_behnken(factors, output="categorical")
+    assert set(df["Catalyst"]) == {"Pt", "Pd", "Rh"}
+    assert set(df["B"]) == {1, 2, 3}
+
+    with pytest.raises(ValueError, match="three levels"):
+        build.box_behnken(
+            {"Catalyst": ["Pt", "Pd"], "B": [1, 3], "C": [0, 10]}, output="codes"
+        )
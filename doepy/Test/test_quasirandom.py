@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from doepy import build, quasirandom
+
+
+def factors():
+    return {"Pressure": [40, 60], "Temperature": [290, 350], "Flow": [0.9, 1.1]}
+
+
+def test_halton_matches_diversipy():
+    diversipy = pytest.importorskip("diversipy")
+    np.testing.assert_array_equal(
+        quasirandom.halton(500, 10), diversipy.halton(num_points=500, dimension=10)
+    )
+
+
+@pytest.mark.parametrize("scramble", [False, True])
+def test_halton_start_and_leap(scramble):
+    whole = quasirandom.halton(1000, 5, scramble=scramble, seed=1)
+    part = quasirandom.halton(100, 5, start=300, scramble=scramble, seed=1)
+    leaped = quasirandom.halton(100, 5, leap=3, scramble=scramble, seed=1)
+    # The scrambled tail of the digits is summed in a different order, up to rounding
+    np.testing.assert_allclose(part, whole[300:400], rtol=0, atol=1e-15)
+    np.testing.assert_allclose(leaped, whole[::3][:100], rtol=0, atol=1e-15)
+
+
+def test_scrambled_halton():
+    x = quasirandom.halton(243, 3, scramble=True, seed=2)
+    assert 0 < x.min() and x.max() < 1
+    np.testing.assert_array_equal(x, quasirandom.halton(243, 3, scramble=True, seed=2))
+    assert not np.array_equal(x, quasirandom.halton(243, 3, scramble=True, seed=3))
+    # The first 3^5 points still put one point in every interval [k / 243, (k + 1) / 243) of the base-3 axis
+    np.testing.assert_array_equal(np.sort((x[:, 1] * 243).astype(int)), np.arange(243))
+
+
+def test_halton_builders():
+    options = dict(num_samples=50, start=10, leap=2, scramble=True, seed=4)
+    df = build.halton(factors(), **options)
+    expected = quasirandom.halton(50, 3, start=10, leap=2, scramble=True, seed=4)
+    np.testing.assert_allclose(
+        df.values, [40, 290, 0.9] + expected * [20, 60, 0.2], rtol=1e-12
+    )
+    chunks = build.iter_halton(factors(), chunk_rows=16, **options)
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+
+@pytest.mark.parametrize("dimension", [1, 2, 7, 40, 200, 1111])
+def test_sobol_matches_scipy(dimension):
+    qmc = pytest.importorskip("scipy.stats.qmc")
+    expected = qmc.Sobol(dimension, scramble=False).random(1024)
+    np.testing.assert_array_equal(quasirandom.sobol(1024, dimension), expected)
+
+
+@pytest.mark.parametrize("scramble", [False, True])
+@pytest.mark.parametrize("start, count", [(0, 1), (1, 5), (1000, 100), (4095, 1)])
+def test_sobol_skip_ahead(scramble, start, count):
+    whole = quasirandom.sobol(4096, 12, scramble=scramble, seed=7)
+    part = quasirandom.sobol(count, 12, start=start, scramble=scramble, seed=7)
+    np.testing.assert_array_equal(part, whole[start : start + count])
+
+
+def test_scrambled_sobol_is_a_net():
+    x = quasirandom.sobol(1024, 20, scramble=True, seed=3)
+    assert 0 < x.min() and x.max() < 1
+    # Every interval [k / 256, (k + 1) / 256) holds 4 points in every dimension
+    for column in x.T:
+        assert (np.bincount((column * 256).astype(int), minlength=256) == 4).all()
+
+
+def test_sobol_dimension_limit():
+    with pytest.raises(ValueError):
+        quasirandom.sobol(8, quasirandom.sobol_max_dimension() + 1)
+
+
+def test_sobol_builders():
+    options = dict(num_samples=40, scramble=True, seed=9, start=8)
+    df = build.sobol(factors(), **options)
+    expected = quasirandom.sobol(40, 3, start=8, scramble=True, seed=9)
+    np.testing.assert_allclose(
+        df.values, [40, 290, 0.9] + expected * [20, 60, 0.2], rtol=1e-12
+    )
+    chunks = build.iter_sobol(factors(), chunk_rows=16, **options)
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+    frames = build.batch("sobol", [factors(), factors()], num_samples=40, seed=9)
+    pd.testing.assert_frame_equal(frames[0], frames[1])
+    pd.testing.assert_frame_equal(frames[0], build.sobol(factors(), 40, seed=9))
+
+
+@pytest.mark.parametrize("bits", [4, 8, 12])
+def test_lattice_prefix_is_a_lattice_rule(bits):
+    n = 1 << bits
+    z = quasirandom.lattice_generating_vector(16)
+    rule = (np.arange(n)[:, np.newaxis] * (z % n) % n) / n
+    points = quasirandom.lattice(n, 16)
+    np.testing.assert_array_equal(
+        np.sort(points.view([("", points.dtype)] * 16), axis=0),
+        np.sort(rule.view([("", rule.dtype)] * 16), axis=0),
+    )
+
+
+def test_lattice_random_access_and_shift():
+    whole = quasirandom.lattice(2048, 8, shift=True, seed=5)
+    part = quasirandom.lattice(48, 8, start=2000, shift=True, seed=5)
+    np.testing.assert_array_equal(part, whole[2000:])
+    assert 0 <= whole.min() and whole.max() < 1
+
+
+def test_custom_generating_vector():
+    z = [1, 5, 7]
+    points = quasirandom.lattice(11, 3, generating_vector=z)
+    np.testing.assert_array_equal(points, (np.arange(11)[:, np.newaxis] * z % 11) / 11)
+    # A custom rule has n = start + num_points points, of which the last ones are taken
+    tail = quasirandom.lattice(3, 3, generating_vector=z, start=8)
+    np.testing.assert_array_equal(tail, points[8:])
+
+
+def test_cbc_criterion_matches_brute_force():
+    # The fast CBC construction gives the same P_2 error as evaluating the candidates one by one
+    n, weights = 1 << 6, np.full(3, 0.05)
+    z = quasirandom.construct_lattice_vector(3, bits=6, min_bits=6, weights=weights)
+
+    def error(vector):
+        k = np.arange(n)[:, np.newaxis]
+        kernel = quasirandom._korobov_kernel((k * np.asarray(vector) % n) / n)
+        return np.prod(1 + weights[: len(vector)] * kernel, axis=1).mean() - 1
+
+    for j in range(1, 3):
+        best = min(error(list(z[:j]) + [c]) for c in range(1, n, 2))
+        assert error(z[: j + 1]) == pytest.approx(best)
+
+
+def test_lattice_builders():
+    options = dict(num_samples=64, shift=True, seed=6, start=64)
+    df = build.lattice(factors(), **options)
+    expected = quasirandom.lattice(64, 3, start=64, shift=True, seed=6)
+    np.testing.assert_allclose(
+        df.values, [40, 290, 0.9] + expected * [20, 60, 0.2], rtol=1e-12
+    )
+    chunks = build.iter_lattice(factors(), chunk_rows=20, **options)
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+    frames = build.batch("lattice", [factors(), factors()], **options)
+    pd.testing.assert_frame_equal(frames[1], df)
@@ -0,0 +1,194 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from doepy import build, read_write
+
+PARAMS_CSV = os.path.join(os.path.dirname(__file__), "..", "Data", "params.csv")
+
+
+def factors():
+    return {
+        "Pressure": [50, 60, 70],
+        "Temperature": [290, 320, 350],
+        "Flow rate": [0.912345, 1.0],
+    }
+
+
+@pytest.fixture
+def design():
+    return build.full_fact(factors())
+
+
+def test_write_csv_in_chunks(tmp_path, design):
+    whole, chunked = str(tmp_path / "whole.csv"), str(tmp_path / "chunked.csv")
+    read_write.write_csv(design, whole)
+    read_write.write_csv(design, chunked, chunk_rows=4)
+    text = open(whole).read()
+    assert text == open(chunked).read()
+    assert text.splitlines()[0] == "Pressure,Temperature,Flow rate"
+    assert text.splitlines()[1] == "50.0,290.0,0.91"
+    assert len(text.splitlines()) == len(design) + 1
+
+
+def test_write_csv_from_iterators(tmp_path, design):
+    expected = str(tmp_path / "expected.csv")
+    read_write.write_csv(design, expected)
+    frames = str(tmp_path / "frames.csv")
+    read_write.write_csv(build.iter_full_fact(factors(), chunk_rows=5), frames)
+    arrays = str(tmp_path / "arrays.csv")
+    read_write.write_csv(
+        build.iter_full_fact(factors(), chunk_rows=5, as_array=True),
+        arrays,
+        columns=list(design.columns),
+    )
+    assert open(frames).read() == open(expected).read()
+    assert open(arrays).read() == open(expected).read()
+
+
+def test_write_csv_leaves_arrays_untouched(tmp_path):
+    x = np.array([[1.23456, 2.34567]])
+    x.setflags(write=False)
+    filename = str(tmp_path / "design.csv")
+    read_write.write_csv(x, filename, columns=["a", "b"])
+    np.testing.assert_array_equal(x, [[1.23456, 2.34567]])
+    assert open(filename).read().splitlines() == ["a,b", "1.23,2.35"]
+
+
+def test_write_csv_rounds_float_categories(tmp_path):
+    def float_factors():
+        return {"Pressure": [1.5, 2.25], "Flow rate": [0.912345, 1.0, 1.10499]}
+
+    values, categorical = str(tmp_path / "values.csv"), str(tmp_path / "cat.csv")
+    read_write.write_csv(build.full_fact(float_factors()), values)
+    df = build.full_fact(float_factors(), output="categorical")
+    read_write.write_csv(df, categorical)
+    assert open(categorical).read() == open(values).read()
+    # The design itself keeps its categories
+    assert list(df["Flow rate"].cat.categories) == [0.912345, 1.0, 1.10499]
+
+
+def test_write_csv_adds_the_extension(tmp_path, design):
+    read_write.write_csv(design, str(tmp_path / "design"))
+    assert (tmp_path / "design.csv").exists()
+
+
+def test_read_variables_csv(tmp_path):
+    path = tmp_path / "params.csv"
+    path.write_text("Pressure,Temperature,Flow rate\n40,290,0.2\n55,320, \n70,,\n")
+    assert read_write.read_variables_csv(str(path)) == {
+        "Pressure": [40.0, 55.0, 70.0],
+        "Temperature": [290.0, 320.0],
+        "Flow rate": [0.2],
+    }
+
+
+def test_read_variables_csv_shipped_example():
+    d = read_write.read_variables_csv(PARAMS_CSV)
+    assert list(d) == ["Pressure", "Temperature", "FlowRate", "Time"]
+    assert d["FlowRate"] == [0.2, 0.3, 0.4]
+
+
+def test_read_variables_csv_errors(tmp_path):
+    with pytest.raises(OSError):
+        read_write.read_variables_csv(str(tmp_path / "missing.csv"))
+
+    empty = tmp_path / "empty.csv"
+    empty.write_text("")
+    with pytest.raises(ValueError, match="empty"):
+        read_write.read_variables_csv(str(empty))
+
+    text = tmp_path / "text.csv"
+    text.write_text("Pressure,Catalyst\n40,Pt\n")
+    with pytest.raises(ValueError, match="'Pt'.*'Catalyst', line 2"):
+        read_write.read_variables_csv(str(text))
+
+
+@pytest.mark.parametrize(
+    "writer, extension", [("write_npy", ".npy"), ("write_npz", ".npz")]
+)
+def test_numpy_round_trip(tmp_path, design, writer, extension):
+    filename = str(tmp_path / "design")
+    getattr(read_write, writer)(design, filename, metadata={"kind": "full_fact"})
+    df = read_write.read_design(filename + extension)
+    pd.testing.assert_frame_equal(df, design)
+    assert df.attrs["metadata"] == {"kind": "full_fact"}
+
+
+def test_npy_round_trip_in_chunks(tmp_path, design):
+    filename = str(tmp_path / "design.npy")
+    read_write.write_npy(build.iter_full_fact(factors(), chunk_rows=4), filename)
+    x, info = read_write.read_design(filename, mmap_mode="r", as_frame=False)
+    assert isinstance(x, np.memmap)
+    np.testing.assert_array_equal(x, design.values)
+    assert info["columns"] == list(design.columns)
+    np.testing.assert_array_equal(np.load(filename), design.values)
+
+
+def test_codes_round_trip(tmp_path):
+    df = build.full_fact({"Catalyst": ["Pt", "Pd", "Rh"], "B": [1, 2]}, output="codes")
+    filename = str(tmp_path / "codes")
+    read_write.write_npy(df, filename)
+    back = read_write.read_design(filename + ".npy")
+    pd.testing.assert_frame_equal(back, df)
+    assert back.dtypes.tolist() == [np.dtype(np.uint8)] * 2
+
+
+def test_categorical_designs_are_rejected(tmp_path):
+    df = build.full_fact({"A": ["x", "y"], "B": [1, 2]}, output="categorical")
+    for writer in (read_write.write_npy, read_write.write_npz):
+        with pytest.raises(ValueError, match="output='codes'"):
+            writer(df, str(tmp_path / "design"))
+    assert not (tmp_path / "design.npy").exists()
+
+
+@pytest.mark.parametrize(
+    "writer, extension, output",
+    [
+        ("write_parquet", ".parquet", "values"),
+        ("write_parquet", ".parquet", "codes"),
+        ("write_feather", ".feather", "values"),
+        ("write_feather", ".feather", "categorical"),
+        ("write_feather", ".feather", "codes"),
+    ],
+)
+def test_arrow_round_trip(tmp_path, writer, extension, output):
+    pytest.importorskip("pyarrow")
+    filename = str(tmp_path / "design")
+    metadata = read_write.design_metadata("full_fact", factors(), output=output)
+    # dtype only applies to the values
+    for dtype in (None, "narrow") if output == "values" else (None,):
+        df = build.full_fact(factors(), dtype=dtype, output=output)
+        getattr(read_write, writer)(df, filename, metadata=metadata)
+        back = read_write.read_design(filename + extension)
+        pd.testing.assert_frame_equal(back, df)
+        assert back.attrs["metadata"] == metadata
+
+
+@pytest.mark.parametrize(
+    "writer, extension", [("write_parquet", ".parquet"), ("write_feather", ".feather")]
+)
+def test_arrow_from_array_chunks(tmp_path, design, writer, extension):
+    pytest.importorskip("pyarrow")
+    filename = str(tmp_path / "design")
+    chunks = build.iter_full_fact(factors(), chunk_rows=4, as_array=True)
+    getattr(read_write, writer)(chunks, filename, columns=list(design.columns))
+    x, info = read_write.read_design(filename + extension, as_frame=False)
+    np.testing.assert_array_equal(x, design.values)
+    assert info == {"columns": list(design.columns), "metadata": {}}
+
+
+def test_parquet_categories(tmp_path):
+    pytest.importorskip("pyarrow")
+    filename = str(tmp_path / "design")
+    df = build.full_fact(
+        {"Catalyst": ["Pt", "Pd", "Rh"], "Flow rate": [0.5, 1.5]}, output="categorical"
+    )
+    read_write.write_parquet(df, filename)
+    back = read_write.read_design(filename + ".parquet")
+    assert list(back["Catalyst"].cat.categories) == ["Pt", "Pd", "Rh"]
+    assert list(back["Catalyst"]) == list(df["Catalyst"])
+    assert back["Flow rate"].dtype == np.float64
+    assert list(back["Flow rate"]) == list(df["Flow rate"])
@@ -0,0 +1,61 @@
+import copy
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from doepy import build
+
+FACTORS = {
+    "Pressure": [50, 60, 70],
+    "Temperature": [290, 320, 350],
+    "Flow rate": [0.9, 1.0, 1.1],
+    "Time": [5, 8, 11],
+}
+
+BUILDERS = [
+    ("full_fact", {}),
+    ("frac_fact_res", {}),
+    ("frac_fact_res", {"res": 3}),
+    ("plackett_burman", {}),
+    ("sukharev", {"num_samples": 20}),
+    ("box_behnken", {}),
+    ("central_composite", {"face": "cci"}),
+    ("halton", {"num_samples": 30}),
+    ("lhs", {"num_samples": 30}),
+    ("space_filling_lhs", {"num_samples": 30}),
+    ("random_k_means", {"num_samples": 30}),
+    ("maximin", {"num_samples": 30}),
+    ("uniform_random", {"num_samples": 30}),
+]
+
+
+def _seeded(builder, **options):
+    # The randomized designs draw from both numpy and the random module (diversipy)
+    np.random.seed(0)
+    random.seed(0)
+    return builder(copy.deepcopy(FACTORS), **options)
+
+
+@pytest.mark.parametrize("name, options", BUILDERS)
+def test_chunks_concatenate_to_the_build(name, options):
+    expected = _seeded(getattr(build, name), **options)
+    chunks = list(_seeded(getattr(build, "iter_" + name), chunk_rows=7, **options))
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+
+@pytest.mark.parametrize("name, options", BUILDERS[:4])
+def test_array_chunks(name, options):
+    expected = _seeded(getattr(build, name), **options)
+    chunks = list(
+        _seeded(getattr(build, "iter_" + name), chunk_rows=5, as_array=True, **options)
+    )
+    assert all(isinstance(chunk, np.ndarray) for chunk in chunks)
+    np.testing.assert_array_equal(np.concatenate(chunks), expected.values)
+
+
+def test_chunk_rows_must_be_positive():
+    with pytest.raises(ValueError):
+        next(build.iter_full_fact(copy.deepcopy(FACTORS), chunk_rows=0))
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from doepy import build
+from doepy.designs import TwoLevelDesign
+from doepy.pydoe_corrected import fracfact_from_masks, masks_by_res
+
+
+@pytest.mark.parametrize("n, res", [(4, 3), (7, 3), (8, 4), (11, 4), (15, 5)])
+def test_from_masks_matches_fracfact_from_masks(n, res):
+    n_base, masks = masks_by_res(n, res)
+    design = TwoLevelDesign.from_masks(n_base, masks)
+    H = fracfact_from_masks(n_base, masks)
+    assert design.shape == H.shape
+    np.testing.assert_array_equal(design.to_matrix(), H)
+    np.testing.assert_array_equal(TwoLevelDesign.from_matrix(H).bits, design.bits)
+
+
+def test_signs_and_partial_unpacking():
+    # 2^7 runs spread over two words per column
+    masks = [1, 2, 4, 8, 16, 32, 64, 7, 120]
+    signs = [1] * 8 + [-1]
+    design = TwoLevelDesign.from_masks(7, masks, signs)
+    H = fracfact_from_masks(7, masks) * signs
+    np.testing.assert_array_equal(design.to_matrix(), H)
+    np.testing.assert_array_equal(design.to_matrix(50, 90), H[50:90])
+
+
+def test_aliasing_and_inner_products():
+    # 2^(4-1) design with D = ABC, so that AB and CD are confounded
+    design = TwoLevelDesign.from_masks(3, [1, 2, 4, 7], columns=list("ABCD"))
+    H = design.to_matrix()
+    assert design.aliased(design.product("A", "B"), design.product("C", "D"))
+    assert design.aliased("D", design.product("A", "B", "C"))
+    assert not design.aliased("A", "B")
+    assert design.inner("A", "B") == H[:, 0] @ H[:, 1] == 0
+    assert design.inner(design.product("A", "B"), "C") == 0
+
+
+def test_correlations():
+    H = np.array([[1, 1, 1], [1, -1, 1], [-1, 1, -1], [-1, -1, 1], [1, 1, -1]])
+    design = TwoLevelDesign.from_matrix(H, columns=["x", "y", "z"])
+    np.testing.assert_allclose(design.correlations().values, (H.T @ H) / 5)
+    assert list(design.correlations().columns) == ["x", "y", "z"]
+
+
+def test_packed_build_matches_frac_fact_res():
+    def factors():
+        return {name: [i, 10 * i + 1] for i, name in enumerate("ABCDEFG", start=1)}
+
+    design = build.packed_frac_fact_res(factors(), res=4)
+    expected = build.frac_fact_res(factors(), res=4)
+    pd.testing.assert_frame_equal(design.to_dataframe(factors()), expected)
+    assert design.nbytes == 7 * 8
+    np.testing.assert_allclose(design.correlations().values, np.eye(7))
@@ -1,7 +1,40 @@
-from pyDOE import *
-from doepy.pydoe_corrected import fullfact_corrected,fracfact_corrected, fracfact_by_res,bbdesign_corrected, ccdesign_corrected
-from diversipy import *
-import pandas as pd
-import numpy as np
+import importlib
+import importlib.util
 
-name = "doepy"
\ No newline at end of file
+name = "doepy"
+
+# Names historically re-exported here through star imports of pyDOE and diversipy.
+# They are resolved on first access instead, so that "import doepy.build" does not
+# load the sampling backends (and SciPy behind them) for jobs that never use them.
+_CORRECTED = (
+    "fullfact_corrected",
+    "fracfact_corrected",
+    "fracfact_by_res",
+    "fracfact_from_masks",
+    "bbdesign_corrected",
+    "ccdesign_corrected",
+)
+_MODULE_ALIASES = {"pd": "pandas", "np": "numpy"}
+_BACKENDS = ("diversipy", "pyDOE")  # diversipy first, as it was star-imported last
+
+
+def __getattr__(attr):
+    # Dunder lookups and submodules (e.g. "from doepy import build") must not load the backends
+    if attr.startswith("__") or importlib.util.find_spec(__name__ + "." + attr):
+        raise AttributeError("module 'doepy' has no attribute '{}'".format(attr))
+
+    if attr in _CORRECTED:
+        value = getattr(importlib.import_module("doepy.pydoe_corrected"), attr)
+    elif attr in _MODULE_ALIASES:
+        value = importlib.import_module(_MODULE_ALIASES[attr])
+    else:
+        for backend in _BACKENDS:
+            module = importlib.import_module(backend)
+            if not attr.startswith("_") and hasattr(module, attr):
+                value = getattr(module, attr)
+                break
+        else:
+            raise AttributeError("module 'doepy' has no attribute '{}'".format(attr))
+
+    globals()[attr] = value
+    return value
@@ -0,0 +1,260 @@
+import json
+import os
+
+import numpy as np
+
+from doepy.pydoe_corrected import fracfact_from_masks
+
+# ==========================================================================================
+# Minimum-aberration 2-level fractional factorial designs
+# ==========================================================================================
+# A 2^(n-p) design with k = n - p base factors is a set of n distinct nonzero vectors of GF(2)^k,
+# the bitmasks of fracfact_from_masks: the k base factors are the unit vectors and every added factor
+# is the product (XOR) of the base factors it selects. A word of the defining relation is a set of
+# columns whose masks XOR to zero, and A_L counts the words of length L. The resolution is the
+# smallest L with A_L > 0, and among designs of equal size the minimum-aberration one has the
+# lexicographically smallest word length pattern (A_3, A_4, ...).
+#
+# The search tracks the pattern up to A_7, which decides every practical comparison. Adding a
+# column never removes words, so each A_L only grows along a search path, and partial designs are
+# ranked by their pattern in a beam search (run a second time over the odd-weight columns, which keeps
+# the designs of resolution IV that the first run misses). Isomorphic partial designs are deduplicated by an invariant
+# (their pattern and the sorted counts of column subsets per XOR value) rather than by a canonical form, which
+# could only merge fewer of them. Results for up to 256 runs and 64 factors are precomputed in
+# Data/min_aberration.json, built with build_table() by this same search: the table saves the search time but
+# is no proof of optimality. An exhaustive enumeration of the designs gives the same patterns for 8 and 16 runs,
+# and for 32, 64 and 128 runs up to 13, 11 and 10 factors. The larger entries are the best designs found.
+
+MAX_WORD_LENGTH = 7
+
+TABLE_FILE = os.path.join(os.path.dirname(__file__), "Data", "min_aberration.json")
+
+_table = None
+
+# Designs searched for on the fly beyond the table, {(n_base, n): (masks, pattern)}
+_searched = {}
+
+
+class _PartialDesign:
+    """
+    Columns of a design together with subset_xor[s][v], the number of s-subsets of the columns XORing to v.
+    """
+
+    __slots__ = ("columns", "subset_xor", "pattern")
+
+    def __init__(self, columns, subset_xor, pattern):
+        self.columns = columns
+        self.subset_xor = subset_xor
+        self.pattern = pattern
+
+    @classmethod
+    def full_factorial(cls, k):
+        size = 1 << k
+        subset_xor = np.zeros((MAX_WORD_LENGTH, size), dtype=np.int64)
+        subset_xor[0, 0] = 1  # the empty set
+        design = cls([], subset_xor, np.zeros(MAX_WORD_LENGTH - 2, dtype=np.int64))
+        for i in range(k):
+            design = design.add(1 << i)
+        return design
+
+    def word_deltas(self, candidates):
+        """
+        Words of length 3 to MAX_WORD_LENGTH created by adding each of the candidate columns,
+        as a (len(candidates), MAX_WORD_LENGTH - 2) array.
+        A new word of length L is an (L - 1)-subset of the columns XORing to the new column.
+        """
+        return self.subset_xor[2:MAX_WORD_LENGTH, candidates].T
+
+    def add(self, column):
+        subset_xor = self.subset_xor.copy()
+        shifted = np.arange(subset_xor.shape[1]) ^ column
+        for s in range(MAX_WORD_LENGTH - 1, 0, -1):
+            subset_xor[s] += subset_xor[s - 1, shifted]
+        pattern = self.pattern + self.subset_xor[2:MAX_WORD_LENGTH, column]
+        return _PartialDesign(self.columns + [column], subset_xor, pattern)
+
+    def signature(self):
+        return tuple(self.pattern) + tuple(
+            tuple(np.sort(counts)) for counts in self.subset_xor[1:4]
+        )
+
+
+def word_length_pattern(n_base, masks):
+    """
+    Returns (A_3, ..., A_7) of the design with n_base base factors whose added factors have the given bitmasks.
+    """
+    design = _PartialDesign.full_factorial(n_base)
+    for mask in masks:
+        design = design.add(int(mask))
+    return [int(count) for count in design.pattern]
+
+
+def pattern_resolution(pattern):
+    """
+    Resolution of a design from its word length pattern (A_3, ..., A_7). A pattern of zeros gives
+    MAX_WORD_LENGTH + 1, meaning a resolution of at least that.
+    """
+    for length, count in enumerate(pattern, start=3):
+        if count:
+            return length
+    return MAX_WORD_LENGTH + 1
+
+
+def search_min_aberration(n_base, max_factors=None, beam_width=64):
+    """
+    Beam search for minimum-aberration designs with 2^n_base runs.
+    Returns a dictionary {n: (added masks, word length pattern)} for every number of factors n from
+    n_base + 1 to max_factors (default: all 2^n_base - 1 columns).
+
+    Starting from the full factorial of the base factors, each step adds one interaction column to every kept
+    design. The extensions are ranked by their word length pattern, duplicates (same invariant) are dropped,
+    and the beam_width best ones are kept. The best design of each step is the result for that number of factors.
+
+    Ranking by the pattern alone favours small designs that cannot grow without words of length 3, so the
+    search is run a second time over the columns of odd weight only. Those designs are of resolution IV or
+    more up to 2^(n_base - 1) factors, and for every n the better of the two results is kept.
+    """
+    size = 1 << n_base
+    if max_factors is None:
+        max_factors = size - 1
+    max_factors = min(max_factors, size - 1)
+
+    # Columns with at least two base factors
+    interactions = [v for v in range(1, size) if v & (v - 1)]
+    odd_weight = [v for v in interactions if bin(v).count("1") % 2]
+
+    results = _beam_search(n_base, interactions, max_factors, beam_width)
+    even_design = _beam_search(
+        n_base, odd_weight, min(max_factors, size // 2), beam_width
+    )
+    for n, (masks, pattern) in even_design.items():
+        if pattern < results[n][1]:
+            results[n] = (masks, pattern)
+    return results
+
+
+def _beam_search(n_base, interactions, max_factors, beam_width):
+    """
+    Beam search of search_min_aberration over the given candidate columns.
+    """
+    size = 1 << n_base
+    beam = [_PartialDesign.full_factorial(n_base)]
+    interactions = np.array(interactions, dtype=np.int64)
+    results = {}
+
+    for n in range(n_base + 1, max_factors + 1):
+        scored = []
+        for b, design in enumerate(beam):
+            used = np.zeros(size, dtype=bool)
+            used[design.columns] = True
+            candidates = interactions[~used[interactions]]
+            patterns = design.pattern + design.word_deltas(candidates)
+            for c, pattern in zip(candidates, patterns):
+                scored.append((tuple(pattern), b, int(c)))
+        scored.sort()
+
+        next_beam = []
+        seen = set()
+        for pattern, b, column in scored:
+            extended = beam[b].add(column)
+            signature = extended.signature()
+            if signature in seen:
+                continue
+            seen.add(signature)
+            next_beam.append(extended)
+            if len(next_beam) == beam_width:
+                break
+
+        beam = next_beam
+        best = beam[0]
+        results[n] = (best.columns[n_base:], [int(count) for count in best.pattern])
+
+    return results
+
+
+def build_table(max_base=8, max_factors=64, beam_width=256, filename=TABLE_FILE):
+    """
+    Runs search_min_aberration for 2^2 to 2^max_base runs and saves the designs as the JSON table
+    read by min_aberration_masks.
+    """
+    designs = {}
+    for n_base in range(2, max_base + 1):
+        found = search_min_aberration(n_base, max_factors, beam_width)
+        designs[str(n_base)] = {
+            str(n): {"masks": masks, "pattern": pattern}
+            for n, (masks, pattern) in found.items()
+        }
+    with open(filename, "w") as f:
+        json.dump(
+            {"max_word_length": MAX_WORD_LENGTH, "designs": designs},
+            f,
+            separators=(",", ":"),
+        )
+
+
+def _load_table():
+    global _table
+    if _table is None:
+        try:
+            with open(TABLE_FILE) as f:
+                _table = json.load(f)["designs"]
+        except OSError:
+            _table = {}
+    return _table
+
+
+def _search(n_base, n):
+    """
+    search_min_aberration for n factors, memoized in the process. The search passes through every smaller
+    number of factors, so those results are kept as well.
+    """
+    if (n_base, n) not in _searched:
+        for count, found in search_min_aberration(n_base, n).items():
+            _searched.setdefault((n_base, count), found)
+    return _searched[(n_base, n)]
+
+
+def min_aberration_masks(n, res):
+    """
+    Number of base factors and bitmasks of the n columns of the minimum-aberration design of resolution
+    at least res with the fewest runs, in the form taken by fracfact_from_masks.
+    Designs are read from the precomputed table, and searched for on the fly beyond it (once per process,
+    the results are memoized).
+    Raises ValueError if no design of that resolution exists (res beyond MAX_WORD_LENGTH + 1 included).
+    """
+    if res > MAX_WORD_LENGTH + 1:
+        raise ValueError(
+            "minimum-aberration designs are available up to resolution {}".format(
+                MAX_WORD_LENGTH + 1
+            )
+        )
+
+    table = _load_table()
+    for n_base in range(1, n + 1):
+        if n_base == n:
+            # Full factorial, no defining relation at all
+            return n_base, [1 << i for i in range(n)]
+        if n > (1 << n_base) - 1:
+            continue
+        if res >= 4 and n > 1 << (n_base - 1):
+            # A design of resolution IV has at most 2^(n_base - 1) factors
+            continue
+
+        entry = table.get(str(n_base), {}).get(str(n))
+        if entry is None:
+            masks, pattern = _search(n_base, n)
+        else:
+            masks, pattern = entry["masks"], entry["pattern"]
+        if pattern_resolution(pattern) >= res:
+            return n_base, [1 << i for i in range(n_base)] + list(masks)
+
+    raise ValueError("design not possible")
+
+
+def fracfact_min_aberration(n, res):
+    """
+    Create the minimum-aberration 2-level fractional factorial design with `n` factors and resolution
+    at least `res`, with the fewest runs. Same layout as fracfact_by_res: coded levels -1 and 1, the base
+    factors first.
+    """
+    return fracfact_from_masks(*min_aberration_masks(n, res))
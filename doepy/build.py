@@ -10,20 +10,56 @@ from doepy.doe_functions import (
     build_random_k_means,
     build_maximin,
     build_halton,
+    build_sobol,
+    build_lattice,
     build_uniform_random,
+    build_batch,
+    iter_build_full_fact,
+    iter_build_frac_fact_res,
+    iter_build_plackett_burman,
+    iter_build_sukharev,
+    iter_build_box_behnken,
+    iter_build_central_composite,
+    iter_build_lhs,
+    iter_build_space_filling_lhs,
+    iter_build_random_k_means,
+    iter_build_maximin,
+    iter_build_halton,
+    iter_build_sobol,
+    iter_build_lattice,
+    iter_build_uniform_random,
 )
+from doepy.designs import FullFactorialDesign, TwoLevelDesign
+from doepy.aberration import min_aberration_masks
+from doepy.pydoe_corrected import masks_by_res
 
 
-def full_fact(d):
+def full_fact(d, dtype=None, output="values"):
     """
     Builds a full factorial design dataframe from a dictionary of factor/level ranges
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,60,70],'Temperature':[290, 320, 350],'Flow rate':[0.9,1.0]}
+    dtype: Column dtype, float64 by default. 'narrow' picks the narrowest dtype holding the levels exactly (e.g. int16), any numpy dtype is also accepted.
+    output: 'values' (default) for the levels, 'categorical' for pandas Categorical columns, or 'codes' for uint8/uint16 level indices with the level table in df.attrs['levels']. The last two also accept non-numeric levels.
     """
-    return build_full_fact(d)
+    return build_full_fact(d, dtype=dtype, output=output)
 
 
-def frac_fact_res(d, res=None):
+def lazy_full_fact(d, dtype=None):
+    """
+    Builds a lazy full factorial design from a dictionary of factor/level ranges, without materializing the design matrix.
+    Example of the dictionary which is needed as the input:
+    {'Pressure':[50,60,70],'Temperature':[290, 320, 350],'Flow rate':[0.9,1.0]}
+    dtype: Column dtype, float64 by default. 'narrow' picks the narrowest dtype holding the levels exactly (e.g. int16), any numpy dtype is also accepted.
+
+    The returned FullFactorialDesign supports len(), random access to any run (design[i]), slicing and
+    iteration in chunks (design.iter_chunks(chunk_rows)). Runs are decoded on demand in the same order as full_fact,
+    so even designs with far more runs than would fit in memory can be dispatched run by run.
+    """
+    return FullFactorialDesign(d, dtype)
+
+
+def frac_fact_res(d, res=None, dtype=None, output="values", min_aberration=False):
     """
     Builds a 2-level fractional factorial design dataframe from a dictionary of factor/level ranges and given resolution.
       
@@ -37,6 +73,24 @@ def frac_fact_res(d, res=None):
     res : int
         Desired design resolution.
         Default: Set to half of the total factor count.
+    dtype : str or numpy dtype
+        Column dtype of the design.
+        Default: float64. 'narrow' picks the narrowest dtype holding the levels exactly.
+    output : str
+        'values' for the levels, 'categorical' for pandas Categorical columns, or 'codes' for
+        uint8 level indices with the level table in df.attrs['levels'].
+        Default: 'values'.
+    min_aberration : bool
+        If True, the design is the minimum-aberration design of resolution at
+        least `res` with the fewest runs, from the table precomputed by
+        doepy.aberration (up to 256 runs and 64 factors). Beyond the table the
+        design is searched for on the fly, which is slow: about a minute for 30
+        factors at resolution 5 (1024 runs). The result is memoized for the rest
+        of the process. The table was built by the same search, a heuristic (beam
+        search of width 64), so its designs are also the best found. They are
+        proven minimum-aberration (by exhaustive enumeration) for 8 and 16 runs,
+        and for 32, 64 and 128 runs up to 13, 11 and 10 factors.
+        Default: False, the first suitable generators are used.
 	
 	Notes
     -----
@@ -80,15 +134,44 @@ def frac_fact_res(d, res=None):
         ValueError: design not possible
     """
 
-    return build_frac_fact_res(d, res=res)
+    return build_frac_fact_res(
+        d, res=res, dtype=dtype, output=output, min_aberration=min_aberration
+    )
+
+
+def packed_frac_fact_res(d, res=None, min_aberration=False):
+    """
+    Builds the 2-level fractional factorial design of frac_fact_res() as a bit-packed TwoLevelDesign,
+    one bit per run and factor instead of a float per cell. Example of the dictionary which is needed as the input:
+    {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
+    res: Desired design resolution. Default: Set to half of the total factor count.
+    min_aberration: If True, the minimum-aberration design of resolution at least res, as for frac_fact_res().
+
+    The design supports column products, aliasing checks and correlations on the packed bits, and
+    design.to_dataframe(d) maps it onto the low and high levels, giving the same table as frac_fact_res(d, res).
+    """
+    factor_count = len(d)
+    if res == None:
+        res = int(factor_count / 2) + 1
+    assert (
+        factor_count > res
+    ), "Number of factors must be greater than desired resolution"
+
+    if min_aberration:
+        n_base, masks = min_aberration_masks(factor_count, res)
+    else:
+        n_base, masks = masks_by_res(factor_count, res)
+    return TwoLevelDesign.from_masks(n_base, masks, columns=list(d.keys()))
 
 
-def plackett_burman(d):
+def plackett_burman(d, dtype=None, output="values"):
     """
     Builds a Plackett-Burman dataframe from a dictionary of factor/level ranges.
     Only min and max values of the range are required.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
+    dtype: Column dtype, float64 by default. 'narrow' picks the narrowest dtype holding the levels exactly (e.g. int16), any numpy dtype is also accepted.
+    output: 'values' (default) for the levels, 'categorical' for pandas Categorical columns, or 'codes' for uint8/uint16 level indices with the level table in df.attrs['levels']. The last two also accept non-numeric levels.
 	
 	Plackett–Burman designs are experimental designs presented in 1946 by Robin L. Plackett and J. P. Burman while working in the British Ministry of Supply.(Their goal was to find experimental designs for investigating the dependence of some measured quantity on a number of independent variables (factors), each taking L levels, in such a way as to minimize the variance of the estimates of these dependencies using a limited number of experiments. 
 	
@@ -99,10 +182,10 @@ def plackett_burman(d):
 	The max number of columns allowed before a design increases the number of rows is always one less than the next higher multiple of four.
     """
 
-    return build_plackett_burman(d)
+    return build_plackett_burman(d, dtype=dtype, output=output)
 
 
-def sukharev(d, num_samples=None):
+def sukharev(d, num_samples=None, dtype=None):
     """
     Builds a Sukharev-grid hypercube design dataframe from a dictionary of factor/level ranges.
     Number of samples raised to the power of (1/dimension), where dimension is the number of variables, must be an integer.
@@ -110,20 +193,24 @@ def sukharev(d, num_samples=None):
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
     num_samples: Number of samples to be generated
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
 	
 	Special property of this grid is that points are not placed on the boundaries of the hypercube, but at centroids of the  subcells constituted by individual samples. 
 	This design offers optimal results for the covering radius regarding distances based on the max-norm.
     """
 
-    return build_sukharev(d, num_samples=num_samples)
+    return build_sukharev(d, num_samples=num_samples, dtype=dtype)
 
 
-def box_behnken(d, center=1):
+def box_behnken(d, center=1, dtype=None, output="values", blocks=None):
     """
     Builds a Box-Behnken design dataframe from a dictionary of factor/level ranges.
     Note 3 levels of factors are necessary. If not given, the function will automatically create 3 levels by linear mid-section method.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,60,70],'Temperature':[290, 320, 350],'Flow rate':[0.9,1.0,1.1]}
+    dtype: Column dtype, float64 by default. 'narrow' picks the narrowest dtype holding the levels exactly (e.g. int16), any numpy dtype is also accepted.
+    output: 'values' (default) for the levels, 'categorical' for pandas Categorical columns, or 'codes' for uint8/uint16 level indices with the level table in df.attrs['levels']. The last two also accept non-numeric levels, given as three explicit levels (a mid level is only created for numeric factors).
+    blocks: Groups of factors varied together. By default, all the pairs of factors. 'bibd' uses a balanced incomplete block design with blocks of 3 factors (available for 6, 7, 9, 13 and 15 factors), which needs fewer runs. A list of blocks of factor indices is also accepted.
 	
 	In statistics, Box–Behnken designs are experimental designs for response surface methodology, devised by George E. P. Box and Donald Behnken in 1960, to achieve the following goals:
 		* Each factor, or independent variable, is placed at one of three equally spaced values, usually coded as −1, 0, +1. (At least three levels are needed for the following goal.)
@@ -131,15 +218,18 @@ def box_behnken(d, center=1):
 		* The ratio of the number of experimental points to the number of coefficients in the quadratic model should be reasonable (in fact, their designs kept it in the range of 1.5 to 2.6).*estimation variance should more or less depend only on the distance from the centre (this is achieved exactly for the designs with 4 and 7 factors), and should not vary too much inside the smallest (hyper)cube containing the experimental points.
 	"""
 
-    return build_box_behnken(d, center=center)
+    return build_box_behnken(
+        d, center=center, dtype=dtype, output=output, blocks=blocks
+    )
 
 
-def central_composite(d, center=(2, 2), alpha="o", face="ccc"):
+def central_composite(d, center=(2, 2), alpha="o", face="ccc", dtype=None):
     """
     Builds a central-composite design dataframe from a dictionary of factor/level ranges.
     Only min and max values of the range are required.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
 	
 	In statistics, a central composite design is an experimental design, useful in response surface methodology, for building a second order (quadratic) model for the response variable without needing to use a complete three-level factorial experiment.
 	The design consists of three distinct sets of experimental runs:
@@ -148,57 +238,73 @@ def central_composite(d, center=(2, 2), alpha="o", face="ccc"):
 		* A set of axial points, experimental runs identical to the centre points except for one factor, which will take on values both below and above the median of the two factorial levels, and typically both outside their range. All factors are varied in this way.
     """
 
-    return build_central_composite(d, center=center, alpha=alpha, face=face)
+    return build_central_composite(
+        d, center=center, alpha=alpha, face=face, dtype=dtype
+    )
 
 
-def lhs(d, num_samples=None, prob_distribution=None):
+def lhs(d, num_samples=None, prob_distribution=None, dtype=None, criterion=None):
     """
     Builds a Latin Hypercube design dataframe from a dictionary of factor/level ranges.
     Only min and max values of the range are required.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
     num_samples: Number of samples to be generated
-    prob_distribution: Analytical probability distribution to be applied over the randomized sampling. 
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
+    prob_distribution: Analytical probability distribution to be applied over the randomized sampling, by the inverse CDF of each factor (see doepy.distributions).
 	Accepts one of the following strings: 
-    'Normal', 'Poisson', 'Exponential', 'Beta', 'Gamma'
+    'Normal', 'Lognormal', 'Triangular', 'Truncnorm', 'Exponential', 'Beta', 'Gamma'
+    or a (name, parameters) tuple like ('normal', {'mean': 60, 'std': 2}) or ('empirical', {'data': measurements}).
+    A dictionary {factor name: distribution} gives each factor its own, the others stay uniform. For these names, the range of a factor sets the default parameters, e.g. a normal factor has its mean in the middle of the range and the range is +/- 3 standard deviations, a beta factor has a = b = 2 over the range, and an exponential or gamma (a = 2) factor starts at the low end and has its 99.9% quantile at the high end.
+    Other scipy.stats names (e.g. 'poisson') need their shape parameters in a tuple, e.g. ('poisson', {'mu': 4}), otherwise a ValueError names the missing ones.
+    criterion: None (default) for a randomized Latin Hypercube. 'maximin' spreads the points apart and 'correlation' decorrelates the factors, both optimized by column swaps (enhanced stochastic evolutionary algorithm), in a few seconds for 2000 runs of 30 factors.
 
 	Latin hypercube sampling (LHS) is a form of stratified sampling that can be applied to multiple variables. The method commonly used to reduce the number or runs necessary for a Monte Carlo simulation to achieve a reasonably accurate random distribution. LHS can be incorporated into an existing Monte Carlo model fairly easily, and work with variables following any analytical probability distribution.
     """
 
-    return build_lhs(d, num_samples=num_samples, prob_distribution=prob_distribution)
+    return build_lhs(
+        d,
+        num_samples=num_samples,
+        prob_distribution=prob_distribution,
+        dtype=dtype,
+        criterion=criterion,
+    )
 
 
-def space_filling_lhs(d, num_samples=None):
+def space_filling_lhs(d, num_samples=None, dtype=None):
     """
     Builds a space-filling Latin Hypercube design dataframe from a dictionary of factor/level ranges.
     Only min and max values of the range are required.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
     num_samples: Number of samples to be generated
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
     """
 
-    return build_space_filling_lhs(d, num_samples=num_samples)
+    return build_space_filling_lhs(d, num_samples=num_samples, dtype=dtype)
 
 
-def random_k_means(d, num_samples=None):
+def random_k_means(d, num_samples=None, dtype=None):
     """
     This function aims to produce a centroidal Voronoi tesselation of the unit random hypercube and generate k-means clusters.
     Only min and max values of the range are required.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
     num_samples: Number of samples to be generated
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
     """
 
-    return build_random_k_means(d, num_samples=num_samples)
+    return build_random_k_means(d, num_samples=num_samples, dtype=dtype)
 
 
-def maximin(d, num_samples=None):
+def maximin(d, num_samples=None, dtype=None):
     """
     Builds a maximin reconstructed design dataframe from a dictionary of factor/level ranges.
     Only min and max values of the range are required.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
     num_samples: Number of samples to be generated
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
 	
 	This algorithm carries out a user-specified number of iterations to maximize the minimal distance of a point in the set to 
 		* other points in the set, 
@@ -206,30 +312,379 @@ def maximin(d, num_samples=None):
 		* the boundary of the hypercube.
     """
 
-    return build_maximin(d, num_samples=num_samples)
+    return build_maximin(d, num_samples=num_samples, dtype=dtype)
 
 
-def halton(d, num_samples=None):
+def halton(d, num_samples=None, dtype=None, start=0, leap=1, scramble=False, seed=None):
     """
     Builds a quasirandom dataframe from a dictionary of factor/level ranges using prime numbers as seed.
     Only min and max values of the range are required.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
     num_samples: Number of samples to be generated
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
+    start: Index of the first run in the Halton sequence (default 0), e.g. 10000 to extend a design of 10000 runs without regenerating them
+    leap: Step between the sequence indices of consecutive runs (default 1)
+    scramble: If True, the digits are randomly permuted per factor, which breaks the correlation between factors in high dimensions. seed makes the scrambling reproducible and consistent across start values.
 
     Quasirandom sequence using the default initialization with first n prime numbers equal to the number of factors/variables.
     """
 
-    return build_halton(d, num_samples=num_samples)
+    return build_halton(
+        d,
+        num_samples=num_samples,
+        dtype=dtype,
+        start=start,
+        leap=leap,
+        scramble=scramble,
+        seed=seed,
+    )
 
 
-def uniform_random(d, num_samples=None):
+def sobol(d, num_samples=None, scramble=True, seed=None, start=0, dtype=None):
+    """
+    Builds a quasirandom dataframe from a dictionary of factor/level ranges using a Sobol sequence.
+    Only min and max values of the range are required.
+    Example of the dictionary which is needed as the input:
+    {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
+    num_samples: Number of samples to be generated. Powers of 2 (e.g. 256, 1024) give the most balanced designs.
+    scramble: If True (default), the sequence is randomly scrambled (linear matrix scrambling and a digital shift), which keeps its uniformity but removes its regular patterns. seed makes the scrambling reproducible.
+    start: Index of the first run in the Sobol sequence (default 0), e.g. 1024 to extend a design of 1024 runs without regenerating them
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
+
+    Up to 1111 factors are supported, with the direction numbers of Joe and Kuo.
+    """
+
+    return build_sobol(
+        d,
+        num_samples=num_samples,
+        scramble=scramble,
+        seed=seed,
+        start=start,
+        dtype=dtype,
+    )
+
+
+def lattice(
+    d,
+    num_samples=None,
+    generating_vector=None,
+    shift=False,
+    seed=None,
+    start=0,
+    dtype=None,
+):
+    """
+    Builds a quasirandom dataframe from a dictionary of factor/level ranges using a rank-1 lattice, whose runs are frac(i * z / n) for a generating vector z.
+    Only min and max values of the range are required.
+    Example of the dictionary which is needed as the input:
+    {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
+    num_samples: Number of samples to be generated. Powers of 2 (e.g. 256, 1024) give the most balanced designs.
+    generating_vector: None (default) for the shipped vector, constructed component by component for 16 to 2^20 runs and up to 1111 factors. Its first 2^m runs form a lattice rule for every m, so start extends a design without regenerating it. A vector of integers (one per factor) gives the lattice rule frac(i * z / n) with n = start + num_samples runs instead.
+    shift: If True, the whole lattice is shifted by a random vector (modulo 1). seed makes the shift reproducible, and designs with different seeds are independent replicates.
+    start: Index of the first run (default 0), e.g. 1024 to extend a design of 1024 runs
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
+    """
+
+    return build_lattice(
+        d,
+        num_samples=num_samples,
+        generating_vector=generating_vector,
+        shift=shift,
+        seed=seed,
+        start=start,
+        dtype=dtype,
+    )
+
+
+def uniform_random(d, num_samples=None, dtype=None):
     """
     Builds a design dataframe with samples drawn from uniform random distribution based on a dictionary of factor/level ranges.
     Only min and max values of the range are required.
     Example of the dictionary which is needed as the input:
     {'Pressure':[50,70],'Temperature':[290, 350],'Flow rate':[0.9,1.0]}
     num_samples: Number of samples to be generated
+    dtype: Column dtype, float64 by default. A numpy dtype (e.g. 'float32' to halve the memory) is also accepted.
     """
 
-    return build_uniform_random(d, num_samples=num_samples)
+    return build_uniform_random(d, num_samples=num_samples, dtype=dtype)
+
+
+def batch(kind, dicts, long_format=False, dtype=None, **params):
+    """
+    Builds the same kind of design for every dictionary of factor/level ranges in a list, e.g. the same
+    central-composite design with different bounds per customer:
+        batch('central_composite', [d1, d2, d3], center=(2, 2))
+    kind: Name of the design function of this module, one of 'full_fact', 'frac_fact_res', 'plackett_burman',
+    'box_behnken', 'central_composite', 'sukharev', 'halton', 'sobol', 'lattice', 'lhs', 'space_filling_lhs', 'random_k_means',
+    'maximin' and 'uniform_random'
+    long_format: If True, returns one DataFrame indexed by (batch, run) instead of a list of DataFrames
+    dtype: Column dtype, float64 by default. 'narrow' and any numpy dtype are also accepted.
+    params: Other arguments of the design function, the same for every dictionary
+
+    The coded matrix of a deterministic design is generated once per number of factors and levels, and all the
+    ranges are mapped onto it in one stacked operation. Randomized designs draw a fresh matrix per dictionary.
+    """
+    return build_batch(kind, dicts, long_format=long_format, dtype=dtype, **params)
+
+
+# ======================================================================================
+# Streaming variants, yielding the design in chunks of at most chunk_rows rows
+# ======================================================================================
+#
+# Each iter_* function takes the same arguments as its counterpart above, plus
+#   chunk_rows: Maximum number of rows per chunk (default 100000)
+#   as_array: If True, chunks are numpy arrays instead of DataFrames (default False)
+#   dtype: Column dtype, as for the functions above (default float64)
+# and returns an iterator over the chunks. DataFrame chunks carry the columns of the design and
+# are indexed by run number, so pd.concat(iter_xxx(d, ...)) gives the same table as xxx(d, ...).
+#
+# full_fact, sukharev, halton, sobol, lattice and uniform_random generate each chunk on the fly, so memory stays
+# flat no matter how big the design is. The other designs compute their (much smaller) normalized
+# matrix up front and only stream the projection onto the factor ranges.
+
+
+def iter_full_fact(d, chunk_rows=100000, as_array=False, dtype=None):
+    """
+    Streaming variant of full_fact(). Runs are decoded chunk by chunk, the full design is never held in memory.
+    """
+    return iter_build_full_fact(
+        d, chunk_rows=chunk_rows, as_array=as_array, dtype=dtype
+    )
+
+
+def iter_frac_fact_res(
+    d, res=None, chunk_rows=100000, as_array=False, dtype=None, min_aberration=False,
+):
+    """
+    Streaming variant of frac_fact_res().
+    """
+    return iter_build_frac_fact_res(
+        d,
+        res=res,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+        min_aberration=min_aberration,
+    )
+
+
+def iter_plackett_burman(d, chunk_rows=100000, as_array=False, dtype=None):
+    """
+    Streaming variant of plackett_burman().
+    """
+    return iter_build_plackett_burman(
+        d, chunk_rows=chunk_rows, as_array=as_array, dtype=dtype
+    )
+
+
+def iter_sukharev(d, num_samples=None, chunk_rows=100000, as_array=False, dtype=None):
+    """
+    Streaming variant of sukharev(). Grid points are decoded chunk by chunk, the full grid is never held in memory.
+    """
+    return iter_build_sukharev(
+        d,
+        num_samples=num_samples,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+    )
+
+
+def iter_box_behnken(
+    d, center=1, chunk_rows=100000, as_array=False, dtype=None, blocks=None
+):
+    """
+    Streaming variant of box_behnken().
+    """
+    return iter_build_box_behnken(
+        d,
+        center=center,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+        blocks=blocks,
+    )
+
+
+def iter_central_composite(
+    d,
+    center=(2, 2),
+    alpha="o",
+    face="ccc",
+    chunk_rows=100000,
+    as_array=False,
+    dtype=None,
+):
+    """
+    Streaming variant of central_composite().
+    """
+    return iter_build_central_composite(
+        d,
+        center=center,
+        alpha=alpha,
+        face=face,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+    )
+
+
+def iter_lhs(
+    d,
+    num_samples=None,
+    prob_distribution=None,
+    chunk_rows=100000,
+    as_array=False,
+    dtype=None,
+    criterion=None,
+):
+    """
+    Streaming variant of lhs().
+    """
+    return iter_build_lhs(
+        d,
+        num_samples=num_samples,
+        prob_distribution=prob_distribution,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+        criterion=criterion,
+    )
+
+
+def iter_space_filling_lhs(
+    d, num_samples=None, chunk_rows=100000, as_array=False, dtype=None
+):
+    """
+    Streaming variant of space_filling_lhs().
+    """
+    return iter_build_space_filling_lhs(
+        d,
+        num_samples=num_samples,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+    )
+
+
+def iter_random_k_means(
+    d, num_samples=None, chunk_rows=100000, as_array=False, dtype=None
+):
+    """
+    Streaming variant of random_k_means().
+    """
+    return iter_build_random_k_means(
+        d,
+        num_samples=num_samples,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+    )
+
+
+def iter_maximin(d, num_samples=None, chunk_rows=100000, as_array=False, dtype=None):
+    """
+    Streaming variant of maximin().
+    """
+    return iter_build_maximin(
+        d,
+        num_samples=num_samples,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+    )
+
+
+def iter_halton(
+    d,
+    num_samples=None,
+    chunk_rows=100000,
+    as_array=False,
+    dtype=None,
+    start=0,
+    leap=1,
+    scramble=False,
+    seed=None,
+):
+    """
+    Streaming variant of halton(). Each chunk continues the Halton sequence where the previous one stopped.
+    """
+    return iter_build_halton(
+        d,
+        num_samples=num_samples,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+        start=start,
+        leap=leap,
+        scramble=scramble,
+        seed=seed,
+    )
+
+
+def iter_sobol(
+    d,
+    num_samples=None,
+    scramble=True,
+    seed=None,
+    start=0,
+    chunk_rows=100000,
+    as_array=False,
+    dtype=None,
+):
+    """
+    Streaming variant of sobol(). Each chunk skips ahead to its first run in the Sobol sequence.
+    """
+    return iter_build_sobol(
+        d,
+        num_samples=num_samples,
+        scramble=scramble,
+        seed=seed,
+        start=start,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+    )
+
+
+def iter_lattice(
+    d,
+    num_samples=None,
+    generating_vector=None,
+    shift=False,
+    seed=None,
+    start=0,
+    chunk_rows=100000,
+    as_array=False,
+    dtype=None,
+):
+    """
+    Streaming variant of lattice(). Each chunk is computed directly from its run indices.
+    """
+    return iter_build_lattice(
+        d,
+        num_samples=num_samples,
+        generating_vector=generating_vector,
+        shift=shift,
+        seed=seed,
+        start=start,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+    )
+
+
+def iter_uniform_random(
+    d, num_samples=None, chunk_rows=100000, as_array=False, dtype=None
+):
+    """
+    Streaming variant of uniform_random(). Samples are drawn chunk by chunk.
+    """
+    return iter_build_uniform_random(
+        d,
+        num_samples=num_samples,
+        chunk_rows=chunk_rows,
+        as_array=as_array,
+        dtype=dtype,
+    )
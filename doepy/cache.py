@@ -0,0 +1,163 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# ==========================================================================================
+# Bounded cache of the coded design matrices, which only depend on the design parameters
+# ==========================================================================================
+# The coded matrices of the fractional factorial, Plackett-Burman, Box-Behnken and central-composite
+# designs are fully determined by the number of factors and the design options, not by the factor ranges.
+# The builders fetch them through design_cache, so that repeated builds only pay for mapping the ranges.
+
+# Bumped whenever a cached generator changes its output, so that stale files of the disk tier are ignored
+# (2: resolution-2 fractional factorials are the ones of the string generators again)
+CACHE_VERSION = 2
+
+
+def _freeze(value):
+    """
+    Hashable equivalent of an argument, turning lists (e.g. a center given as [2, 2]) and arrays
+    (e.g. a table of blocks) into tuples.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, tuple(value.ravel().tolist()))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class DesignCache:
+    """
+    Least-recently-used cache of coded design matrices, bounded by a number of entries and a number of bytes.
+    Cached arrays are made read-only, so a caller cannot corrupt the matrices handed to later builds.
+
+    max_entries: Maximum number of matrices kept in memory (0 disables the cache)
+    max_bytes: Maximum total size of the matrices kept in memory
+    directory: Optional folder of an on-disk tier. Matrices are saved there as .npy files and read back
+               (memory-mapped) when they are not in memory, e.g. in a new process.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=64 * 2 ** 20, directory=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+    def configure(self, max_entries=None, max_bytes=None, directory=None):
+        """
+        Changes the limits (or the disk folder) of the cache, evicting entries if needed.
+        """
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if directory is not None:
+                self.directory = directory
+            self._evict()
+
+    def stats(self):
+        """
+        Returns the hit/miss counters and the current size of the cache as a dictionary.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self):
+        """
+        Empties the memory tier and resets the counters. Files of the disk tier are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+    def call(self, func, *args):
+        """
+        Returns func(*args), computing it only if it is in neither the memory nor the disk tier.
+        func must be deterministic and return a numpy array.
+        """
+        key = (func.__module__, func.__name__, _freeze(args))
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        x = self._load(key)
+        if x is None:
+            x = np.asarray(func(*args))
+            x.setflags(write=False)
+            self._save(key, x)
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.disk_hits += 1
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = x
+                self._bytes += x.nbytes
+                self._evict()
+        return x
+
+    def _evict(self):
+        # Called with the lock held
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, x = self._entries.popitem(last=False)
+            self._bytes -= x.nbytes
+            self.evictions += 1
+
+    def _path(self, key):
+        import hashlib  # only needed by the disk tier
+
+        digest = hashlib.sha1(repr((CACHE_VERSION, key)).encode()).hexdigest()
+        return os.path.join(self.directory, "{}_{}.npy".format(key[1], digest))
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            return np.load(self._path(key), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, key, x):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        temp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                np.save(f, x)
+            os.replace(temp_path, path)
+        except OSError:
+            # The disk tier is best effort, the matrix is still returned and kept in memory
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+design_cache = DesignCache()
@@ -0,0 +1,346 @@
+import numbers
+
+import numpy as np
+import pandas as pd
+
+from doepy.doe_functions import lookup_levels, resolve_dtype
+from doepy.instrumentation import building, phase
+
+# ==========================================================================
+# Lazy full factorial design, decoding runs on demand instead of storing them
+# ==========================================================================
+
+
+class FullFactorialDesign:
+    """
+    Lazy, row-addressable full factorial design built from a dictionary of factor/level ranges.
+    Example of the dictionary which is needed as the input:
+    {'Pressure':[50,60,70],'Temperature':[290, 320, 350],'Flow rate':[0.9,1.0]}
+    dtype: Column dtype, float64 by default. 'narrow' picks the narrowest dtype holding the levels exactly.
+
+    The design matrix is never materialized. Run number i is decoded on demand as a mixed-radix number
+    whose digits are the level indices of the factors, the first factor changing fastest. This is the same
+    run order as ``build.full_fact``, so ``design[a:b]`` equals ``build.full_fact(d)[a:b]``.
+
+    Supported operations:
+        * ``len(design)``: number of runs, i.e. the product of the level counts
+        * ``design[i]``: a single run as a Series indexed by factor name, in O(k) for k factors
+        * ``design[a:b:c]`` or ``design[[i, j, ...]]``: the selected runs as a DataFrame
+        * ``design.iter_chunks(chunk_rows)``: consecutive DataFrames of at most chunk_rows runs
+        * ``design.codes(indices)``: the integer level indices of the selected runs
+        * ``design.to_frame()``: the whole design as a DataFrame
+    """
+
+    def __init__(self, factor_level_ranges, dtype=None):
+        self.columns = list(factor_level_ranges.keys())
+        self.levels = [list(factor_level_ranges[key]) for key in self.columns]
+        self.level_counts = [len(lvl) for lvl in self.levels]
+        self.dtype = resolve_dtype(dtype, self.levels)
+
+        # Place value of each factor in the mixed-radix run number
+        self.strides = []
+        size = 1
+        for count in self.level_counts:
+            self.strides.append(size)
+            size *= count
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return "FullFactorialDesign({} runs x {} factors: {})".format(
+            self.size, len(self.columns), ", ".join(map(str, self.columns))
+        )
+
+    def _check_index(self, i):
+        if i < 0:
+            i += self.size
+        if not 0 <= i < self.size:
+            raise IndexError(
+                "run index out of range for a design with {} runs".format(self.size)
+            )
+        return i
+
+    def codes(self, indices):
+        """
+        Decodes an array of run indices into the (len(indices), k) matrix of level indices.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        strides = np.asarray(self.strides, dtype=np.int64)
+        counts = np.asarray(self.level_counts, dtype=np.int64)
+        return (indices[:, np.newaxis] // strides) % counts
+
+    def rows(self, indices):
+        """
+        Returns the runs at the given indices as a DataFrame indexed by run number.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if indices.size and (indices.min() < 0 or indices.max() >= self.size):
+            raise IndexError(
+                "run index out of range for a design with {} runs".format(self.size)
+            )
+        with building("FullFactorialDesign"):
+            data = self._decode(indices)
+            with phase("frame") as p:
+                frame = pd.DataFrame(
+                    data=data, index=indices, columns=self.columns, copy=False
+                )
+                p.set_shape(frame.shape)
+        return frame
+
+    def _decode(self, indices):
+        """
+        Levels of the runs at the given indices, reported as the generate and map phases of a build.
+        """
+        with phase("generate") as p:
+            codes = self.codes(indices)
+            p.set_shape(codes.shape)
+        with phase("map") as p:
+            data = lookup_levels(codes, self.levels, dtype=self.dtype)
+            p.set_shape(data.shape)
+        return data
+
+    def __getitem__(self, key):
+        if isinstance(key, numbers.Integral):
+            i = self._check_index(int(key))
+            values = [
+                lvl[(i // stride) % count]
+                for lvl, stride, count in zip(
+                    self.levels, self.strides, self.level_counts
+                )
+            ]
+            return pd.Series(values, index=self.columns, name=i, dtype=self.dtype)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.size)
+            return self.rows(np.arange(start, stop, step, dtype=np.int64))
+        indices = np.asarray(key, dtype=np.int64)
+        return self.rows(np.where(indices < 0, indices + self.size, indices))
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self[i]
+
+    def iter_chunks(self, chunk_rows=100000, start=0, stop=None, as_array=False):
+        """
+        Yields the runs from start (inclusive) to stop (exclusive) as consecutive DataFrames
+        of at most chunk_rows rows, or plain numpy arrays if as_array is True.
+        Only one chunk is held in memory at a time.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be a positive integer")
+        start, stop, _ = slice(start, stop).indices(self.size)
+        for chunk_start in range(start, stop, chunk_rows):
+            indices = np.arange(chunk_start, min(chunk_start + chunk_rows, stop))
+            if as_array:
+                with building("FullFactorialDesign"):
+                    chunk = self._decode(indices)
+            else:
+                chunk = self.rows(indices)
+            yield chunk
+
+    def to_frame(self):
+        """
+        Materializes the whole design as a DataFrame.
+        """
+        return self[:]
+
+
+# ==========================================================================
+# Bit-packed two-level design, one bit per run and factor
+# ==========================================================================
+
+# Words holding the runs of a packed column, run r being bit r % 64 of word r // 64
+_WORD = np.dtype("<u8")
+
+# Bits of a word at which main factor i (i < 6) is at its high level, for runs 0 to 63
+_BASE_PATTERNS = [sum(1 << r for r in range(64) if (r >> i) & 1) for i in range(6)]
+
+
+def _popcount(words):
+    """
+    Number of set bits of every entry of an unsigned integer array, summed over the last axis.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    as_bytes = np.ascontiguousarray(words).view(np.uint8)
+    as_bytes = as_bytes.reshape(words.shape[:-1] + (-1,))
+    return np.unpackbits(as_bytes, axis=-1).sum(axis=-1, dtype=np.int64)
+
+
+class TwoLevelDesign:
+    """
+    Bit-packed two-level design (e.g. a full or fractional factorial, or a Plackett-Burman design).
+
+    Each factor is stored as a column of bits packed into 64-bit words, so a design of 2^20 runs and 40 factors
+    takes 5 MB instead of the 320 MB of its float64 matrix of -1/+1 levels. A set bit stands for the low (-1) level,
+    which turns the product of -1/+1 columns into the exclusive or (XOR) of their bits.
+
+    Supported operations:
+        * ``design.product(i, j, ...)``: the packed column of an interaction, computed by XOR
+        * ``design.inner(a, b)``: the -1/+1 inner product of two packed columns, from the popcount of their XOR
+        * ``design.aliased(a, b)``: whether two columns (or interactions) are confounded
+        * ``design.correlations()``: the correlation matrix of all factor columns
+        * ``design.to_matrix(start, stop)``: the -1/+1 matrix of a range of runs
+        * ``design.to_dataframe(factor_level_ranges)``: the design mapped onto the low and high factor levels
+    """
+
+    def __init__(self, bits, n_runs, columns=None):
+        self.bits = np.ascontiguousarray(bits, dtype=_WORD)
+        self.n_runs = int(n_runs)
+        if self.bits.ndim != 2 or self.bits.shape[1] != -(-self.n_runs // 64):
+            raise ValueError(
+                "bits must hold {} words per column".format(-(-self.n_runs // 64))
+            )
+        if columns is None:
+            columns = list(range(self.bits.shape[0]))
+        self.columns = list(columns)
+
+    @classmethod
+    def from_matrix(cls, H, columns=None):
+        """
+        Packs a matrix of -1/+1 levels (runs x factors), e.g. from ``ff2n_corrected`` or ``pbdesign``.
+        """
+        H = np.asarray(H)
+        n_runs = H.shape[0]
+        packed = np.packbits(H.T < 0, axis=1, bitorder="little")
+        words = np.zeros((H.shape[1], -(-n_runs // 64) * 8), dtype=np.uint8)
+        words[:, : packed.shape[1]] = packed
+        return cls(words.view(_WORD), n_runs, columns)
+
+    @classmethod
+    def from_masks(cls, n_base, masks, signs=None, columns=None):
+        """
+        Packed equivalent of ``fracfact_from_masks``: 2^n_base runs, column j being the product of the main factors
+        selected by the bits of masks[j], times signs[j]. The columns are computed word by word,
+        without ever building the -1/+1 matrix.
+        """
+        n_base = int(n_base)
+        n_runs = 1 << n_base
+        n_words = -(-n_runs // 64)
+        word_index = np.arange(n_words, dtype=np.uint64)
+        valid = np.uint64((1 << min(n_runs, 64)) - 1)
+
+        # Low-level bits of the main factors
+        base = np.empty((n_base, n_words), dtype=_WORD)
+        for i in range(n_base):
+            if i < 6:
+                base[i] = ~np.uint64(_BASE_PATTERNS[i]) & valid
+            else:
+                high = (word_index >> np.uint64(i - 6)) & np.uint64(1)
+                base[i] = np.where(high, np.uint64(0), valid)
+
+        masks = [int(mask) for mask in masks]
+        if signs is None:
+            signs = [1] * len(masks)
+        bits = np.zeros((len(masks), n_words), dtype=_WORD)
+        for j, mask in enumerate(masks):
+            if not 0 < mask < n_runs:
+                raise ValueError(
+                    "mask {} does not select any of the {} base factors only".format(
+                        mask, n_base
+                    )
+                )
+            for i in range(n_base):
+                if (mask >> i) & 1:
+                    bits[j] ^= base[i]
+            if signs[j] < 0:
+                bits[j] ^= valid
+        return cls(bits, n_runs, columns)
+
+    @property
+    def shape(self):
+        return (self.n_runs, len(self.columns))
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def __len__(self):
+        return self.n_runs
+
+    def __repr__(self):
+        return "TwoLevelDesign({} runs x {} factors, {} bytes packed)".format(
+            self.n_runs, len(self.columns), self.nbytes
+        )
+
+    def _column(self, key):
+        if isinstance(key, np.ndarray):
+            return key
+        return self.bits[self.columns.index(key)]
+
+    def product(self, *keys):
+        """
+        Packed column of the interaction (product) of the given factors, or of packed columns.
+        """
+        out = np.zeros(self.bits.shape[1], dtype=_WORD)
+        for key in keys:
+            out ^= self._column(key)
+        return out
+
+    def inner(self, a, b):
+        """
+        Inner product of two columns of -1/+1 levels (factors or packed columns), i.e. the number of runs
+        at which they agree minus the number at which they differ.
+        """
+        return self.n_runs - 2 * int(_popcount(self._column(a) ^ self._column(b)))
+
+    def aliased(self, a, b):
+        """
+        True if the two columns (factors or packed interactions) are fully confounded, with either sign.
+        """
+        return abs(self.inner(a, b)) == self.n_runs
+
+    def correlations(self):
+        """
+        Correlation matrix of the factor columns, computed from popcounts. Zero off the diagonal means orthogonal.
+        """
+        k = len(self.columns)
+        differ = np.empty((k, k), dtype=np.int64)
+        for j in range(k):
+            differ[j] = _popcount(self.bits ^ self.bits[j])
+        return pd.DataFrame(
+            (self.n_runs - 2 * differ) / self.n_runs,
+            index=self.columns,
+            columns=self.columns,
+        )
+
+    def _low_bits(self, start, stop):
+        """
+        (stop - start, k) matrix of 1 where a run is at the low level.
+        """
+        start, stop, _ = slice(start, stop).indices(self.n_runs)
+        first, last = start // 64, -(-stop // 64)
+        as_bytes = self.bits[:, first:last].view(np.uint8)
+        unpacked = np.unpackbits(as_bytes, axis=1, bitorder="little")
+        offset = start - first * 64
+        return unpacked[:, offset : offset + stop - start].T
+
+    def to_matrix(self, start=0, stop=None, dtype=np.float64):
+        """
+        Unpacks the runs from start to stop into a matrix of -1/+1 levels.
+        """
+        low = self._low_bits(start, stop)
+        return (1 - 2 * low.astype(np.int8)).astype(dtype)
+
+    def to_dataframe(self, factor_level_ranges=None, start=0, stop=None, dtype=None):
+        """
+        Unpacks the runs from start to stop into a DataFrame.
+        With a dictionary of factor/level ranges, the low and high levels are the first and last entries of the
+        ranges, in the order of the columns. Without it, the DataFrame holds the -1/+1 levels.
+        """
+        start, stop, _ = slice(start, stop).indices(self.n_runs)
+        index = pd.RangeIndex(start, stop)
+        if factor_level_ranges is None:
+            data = self.to_matrix(start, stop, dtype=dtype or np.float64)
+            return pd.DataFrame(data, index=index, columns=self.columns, copy=False)
+
+        levels = [
+            [factor_level_ranges[key][0], factor_level_ranges[key][-1]]
+            for key in factor_level_ranges
+        ]
+        codes = 1 - self._low_bits(start, stop)
+        data = lookup_levels(codes, levels, dtype)
+        return pd.DataFrame(
+            data, index=index, columns=list(factor_level_ranges.keys()), copy=False
+        )
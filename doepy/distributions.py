@@ -0,0 +1,248 @@
+import numpy as np
+
+from doepy.doe_functions import resolve_dtype
+
+# ==========================================================================================
+# Inverse-CDF stage mapping a unit hypercube matrix onto per-factor probability distributions
+# ==========================================================================================
+# A Latin hypercube stratifies every factor over [0, 1). Passing each column through the inverse CDF
+# (quantile function) of a distribution gives a sample of that distribution with the same stratification.
+# The distribution of each factor is given by a name, or a (name, parameters) tuple, and defaults are
+# derived from the factor range [low, high]:
+#   uniform     : low to high (the default, same as without a distribution)
+#   normal      : mean (default: mid of the range) and std (default: a sixth of the range, i.e. +/- 3 std)
+#   truncnorm   : normal with the same defaults, truncated to the range
+#   lognormal   : mu and sigma of the log (default: the range is +/- 3 sigma around the geometric mean)
+#   triangular  : mode (default: mid of the range), from low to high
+#   empirical   : data, a sample whose empirical quantiles are used (linear interpolation)
+#   beta        : a = b = 2, stretched over the range
+#   exponential : starting at low, with the scale putting the 99.9% quantile at high
+#   gamma       : a = 2, starting at low, with the scale putting the 99.9% quantile at high
+# Any other name is looked up in scipy.stats (e.g. 'poisson', 'weibull_min'), with loc defaulting to low.
+# Those have no default shape parameters: they must be given, e.g. ('poisson', {'mu': 4}).
+# Columns sharing a distribution are transformed together, with one array of parameters per column.
+
+# Quantile of the exponential and gamma distributions placed at the high end of the range by default
+_TOP_QUANTILE = 0.999
+
+_ALIASES = {
+    "norm": "normal",
+    "gaussian": "normal",
+    "truncated_normal": "truncnorm",
+    "lognorm": "lognormal",
+    "triang": "triangular",
+    "exponential": "expon",
+}
+
+
+def _parse_spec(spec):
+    """
+    Name and parameters of a distribution given as None, a name or a (name, parameters) tuple.
+    """
+    if spec is None:
+        return "uniform", {}
+    if isinstance(spec, str):
+        name, params = spec, {}
+    else:
+        name, params = spec
+        params = dict(params)
+    name = name.lower()
+    return _ALIASES.get(name, name), params
+
+
+class DistributionStage:
+    """
+    Maps unit hypercube matrices onto the distributions of the factors, chunk by chunk if needed.
+    prob_distribution: one distribution for all the factors, or a dictionary {factor name: distribution}
+    (factors left out stay uniform). A distribution is a name or a (name, parameters) tuple, e.g.
+    'normal', ('normal', {'mean': 60, 'std': 2}), ('triangular', {'mode': 300}) or ('empirical', {'data': x}).
+    factor_names: names of the factors, in the order of the columns
+    bounds: (factors, 2) array of the low and high end of every factor
+    The parameters of every column are resolved once, so calling the stage on many chunks costs nothing more.
+    """
+
+    def __init__(self, prob_distribution, factor_names, bounds):
+        factor_names = list(factor_names)
+        bounds = np.asarray(bounds, dtype=np.float64)
+        if isinstance(prob_distribution, dict):
+            unknown = set(prob_distribution) - set(factor_names)
+            if unknown:
+                raise ValueError(
+                    "prob_distribution names unknown factors: {}".format(
+                        ", ".join(map(str, sorted(unknown, key=str)))
+                    )
+                )
+            specs = [prob_distribution.get(name) for name in factor_names]
+        else:
+            specs = [prob_distribution] * len(factor_names)
+
+        # {name: (column indices, parameter dictionaries)}, in order of appearance
+        groups = {}
+        for j, spec in enumerate(specs):
+            name, params = _parse_spec(spec)
+            low, high = bounds[j, 0], bounds[j, -1]
+            columns, column_params = groups.setdefault(name, ([], []))
+            columns.append(j)
+            column_params.append(self._defaults(name, params, low, high))
+
+        self.transforms = [
+            (np.array(columns), self._compile(name, column_params))
+            for name, (columns, column_params) in groups.items()
+        ]
+
+    @staticmethod
+    def _defaults(name, params, low, high):
+        params = dict(params)
+        if name in ("uniform", "triangular", "truncnorm"):
+            params.setdefault("low", low)
+            params.setdefault("high", high)
+        if name in ("normal", "truncnorm"):
+            params.setdefault("mean", (low + high) / 2)
+            params.setdefault("std", abs(high - low) / 6)
+        elif name == "triangular":
+            params.setdefault("mode", (low + high) / 2)
+        elif name == "lognormal":
+            if "mu" not in params or "sigma" not in params:
+                if low <= 0 or high <= 0:
+                    raise ValueError(
+                        "lognormal factors need a positive range, or explicit mu and sigma"
+                    )
+                log_low, log_high = np.log(low), np.log(high)
+                params.setdefault("mu", (log_low + log_high) / 2)
+                params.setdefault("sigma", abs(log_high - log_low) / 6)
+        elif name == "empirical":
+            if "data" not in params:
+                raise ValueError("empirical distributions need a 'data' sample")
+            params["data"] = np.sort(np.asarray(params["data"], dtype=np.float64))
+        elif name != "uniform":
+            from scipy import stats
+
+            distribution = getattr(stats, name, None)
+            if not isinstance(distribution, (stats.rv_continuous, stats.rv_discrete)):
+                raise ValueError("Unknown probability distribution {!r}".format(name))
+            params.setdefault("loc", low)
+            if name == "beta":
+                params.setdefault("a", 2.0)
+                params.setdefault("b", 2.0)
+                params.setdefault("scale", abs(high - low))
+            elif name in ("expon", "gamma"):
+                if name == "gamma":
+                    params.setdefault("a", 2.0)
+                if "scale" not in params:
+                    # The range ends at the 99.9% quantile
+                    shapes = {"a": params["a"]} if name == "gamma" else {}
+                    params["scale"] = abs(high - low) / distribution.ppf(
+                        _TOP_QUANTILE, **shapes
+                    )
+            required = distribution.shapes.split(", ") if distribution.shapes else []
+            missing = [shape for shape in required if shape not in params]
+            if missing:
+                raise ValueError(
+                    "{} factors need the shape parameters {}, e.g. ('{}', {{{}}})".format(
+                        name,
+                        ", ".join(missing),
+                        name,
+                        ", ".join("'{}': ...".format(shape) for shape in missing),
+                    )
+                )
+        return params
+
+    @staticmethod
+    def _compile(name, column_params):
+        """
+        Function mapping the (rows, columns) block of a group from [0, 1] onto its distributions.
+        """
+
+        def stacked(key):
+            return np.array([params[key] for params in column_params], dtype=np.float64)
+
+        if name == "uniform":
+            low, high = stacked("low"), stacked("high")
+            span = np.abs(high - low)
+            return lambda u: u * span + low
+
+        if name == "normal":
+            mean, std = stacked("mean"), stacked("std")
+
+            def normal(u):
+                from scipy.special import ndtri
+
+                return mean + std * ndtri(u)
+
+            return normal
+
+        if name == "truncnorm":
+            mean, std = stacked("mean"), stacked("std")
+            low, high = stacked("low"), stacked("high")
+
+            def truncnorm(u):
+                from scipy.special import ndtr, ndtri
+
+                cdf_low = ndtr((low - mean) / std)
+                cdf_high = ndtr((high - mean) / std)
+                x = mean + std * ndtri(cdf_low + u * (cdf_high - cdf_low))
+                return np.clip(x, low, high)
+
+            return truncnorm
+
+        if name == "lognormal":
+            mu, sigma = stacked("mu"), stacked("sigma")
+
+            def lognormal(u):
+                from scipy.special import ndtri
+
+                return np.exp(mu + sigma * ndtri(u))
+
+            return lognormal
+
+        if name == "triangular":
+            low, mode, high = stacked("low"), stacked("mode"), stacked("high")
+            span = high - low
+            split = (mode - low) / span
+
+            def triangular(u):
+                rising = low + np.sqrt(u * span * (mode - low))
+                falling = high - np.sqrt((1 - u) * span * (high - mode))
+                return np.where(u < split, rising, falling)
+
+            return triangular
+
+        if name == "empirical":
+            samples = [params["data"] for params in column_params]
+
+            def empirical(u):
+                out = np.empty(u.shape)
+                for j, data in enumerate(samples):
+                    out[:, j] = np.interp(
+                        u[:, j], np.linspace(0.0, 1.0, len(data)), data
+                    )
+                return out
+
+            return empirical
+
+        from scipy import stats
+
+        distribution = getattr(stats, name, None)
+        if not isinstance(distribution, (stats.rv_continuous, stats.rv_discrete)):
+            raise ValueError("Unknown probability distribution {!r}".format(name))
+        keys = sorted(column_params[0])
+        if any(sorted(params) != keys for params in column_params):
+            raise ValueError(
+                "All the {} factors need the same parameter names".format(name)
+            )
+        arrays = {key: stacked(key) for key in keys}
+        return lambda u: distribution.ppf(u, **arrays)
+
+    def __call__(self, u, dtype=None):
+        """
+        Maps the unit hypercube matrix u (rows x factors) onto the distributions of the factors.
+        dtype is resolved by resolve_dtype.
+        """
+        u = np.asarray(u, dtype=np.float64)
+        out = np.empty(u.shape, dtype=resolve_dtype(dtype), order="F")
+        for columns, transform in self.transforms:
+            if len(columns) == u.shape[1]:
+                out[...] = transform(u)
+            else:
+                out[:, columns] = transform(u[:, columns])
+        return out
@@ -0,0 +1,179 @@
+import functools
+import threading
+import time
+import tracemalloc
+import types
+from contextlib import contextmanager
+
+# ==========================================================================================
+# Opt-in timing and memory instrumentation of the phases of a design build
+# ==========================================================================================
+# Every build_* function runs the same phases, reported under these names:
+#   normalize : checking and completing the dictionary of factor/level ranges
+#   generate  : computing the coded (or unit hypercube) matrix with pyDOE, diversipy or doepy itself
+#   map       : projecting the coded matrix onto the actual factor levels
+#   frame     : wrapping the mapped matrix into a DataFrame
+# The streaming iter_build_* functions report generate, map and frame for every chunk they yield.
+# Nothing is measured unless a listener is registered, so the builders only pay a function call per phase.
+
+PHASES = ("normalize", "generate", "map", "frame")
+
+_listeners = []
+_state = threading.local()
+
+
+class PhaseRecord:
+    """
+    Measurements of one phase of one design build.
+    builder is the name of the build function (e.g. 'build_lhs'), phase one of PHASES,
+    seconds the wall time, peak_bytes the largest amount of memory allocated at once during the phase on top of
+    what was allocated when it started (None unless memory tracing was requested), and shape the shape of the
+    matrix the phase produced.
+    """
+
+    __slots__ = ("builder", "phase", "seconds", "peak_bytes", "shape")
+
+    def __init__(self, builder, phase):
+        self.builder = builder
+        self.phase = phase
+        self.seconds = None
+        self.peak_bytes = None
+        self.shape = None
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return "PhaseRecord({builder}.{phase}: {seconds:.6f} s, peak {peak_bytes} B, shape {shape})".format(
+            **self.as_dict()
+        )
+
+
+def add_listener(callback, memory=False):
+    """
+    Registers callback(record) to be called with a PhaseRecord at the end of every phase of every build.
+    If memory is True, tracemalloc is used to report the peak allocated bytes of each phase.
+    Tracing memory slows down the builds noticeably, and resets the tracemalloc peak at the start of each phase.
+    """
+    _listeners.append((callback, memory))
+
+
+def remove_listener(callback):
+    """
+    Unregisters a callback added with add_listener.
+    """
+    for i, (registered, _) in enumerate(_listeners):
+        if registered == callback:
+            del _listeners[i]
+            return
+    raise ValueError("callback is not a registered listener")
+
+
+@contextmanager
+def profile_phases(memory=True):
+    """
+    Context manager collecting the PhaseRecord of every build phase run inside the block into a list.
+    Example:
+        with profile_phases() as records:
+            build.lhs(d, num_samples=10**6)
+        for record in records:
+            print(record.builder, record.phase, record.seconds, record.peak_bytes, record.shape)
+    """
+    records = []
+    add_listener(records.append, memory=memory)
+    try:
+        yield records
+    finally:
+        remove_listener(records.append)
+
+
+@contextmanager
+def building(name):
+    """
+    Context manager naming the build the phases run inside the block are reported for,
+    unless they already run inside another build.
+    """
+    outer = getattr(_state, "builder", None)
+    _state.builder = outer or name
+    try:
+        yield
+    finally:
+        _state.builder = outer
+
+
+def instrumented(func):
+    """
+    Decorator naming the build function the phases run inside it are reported for.
+    If the function returns a generator (the streaming builders), the phases run for every chunk
+    are reported for it as well.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with building(func.__name__):
+            result = func(*args, **kwargs)
+        if isinstance(result, types.GeneratorType):
+            return _instrumented_chunks(result, func.__name__)
+        return result
+
+    return wrapper
+
+
+def _instrumented_chunks(chunks, name):
+    """
+    Yields the chunks of a streaming build, producing each one inside the context of the build.
+    """
+    while True:
+        with building(name):
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+        yield chunk
+
+
+class phase:
+    """
+    Context manager timing one phase of a build and reporting it to the listeners.
+    Inside the block, set_shape() records the shape of the matrix the phase produced.
+    With no listener registered, it does nothing.
+    """
+
+    __slots__ = ("record", "traced", "started_tracing", "baseline", "start")
+
+    def __init__(self, name):
+        if _listeners:
+            self.record = PhaseRecord(getattr(_state, "builder", None), name)
+        else:
+            self.record = None
+
+    def __enter__(self):
+        if self.record is not None:
+            self.traced = any(memory for _, memory in _listeners)
+            self.started_tracing = False
+            if self.traced:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self.started_tracing = True
+                tracemalloc.reset_peak()
+                self.baseline = tracemalloc.get_traced_memory()[0]
+            self.start = time.perf_counter()
+        return self
+
+    def set_shape(self, shape):
+        if self.record is not None:
+            self.record.shape = tuple(shape)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        record = self.record
+        if record is None:
+            return False
+        record.seconds = time.perf_counter() - self.start
+        if self.traced:
+            record.peak_bytes = tracemalloc.get_traced_memory()[1] - self.baseline
+            if self.started_tracing:
+                tracemalloc.stop()
+        if exc_type is None:
+            for callback, _ in list(_listeners):
+                callback(record)
+        return False
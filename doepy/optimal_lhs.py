@@ -0,0 +1,212 @@
+import numpy as np
+
+# ==========================================================================================
+# Optimized Latin hypercubes by the enhanced stochastic evolutionary (ESE) algorithm
+# ==========================================================================================
+# Jin, Chen and Sudjianto (2005). The design is a matrix of integer levels, each column a permutation
+# of 0 .. samples - 1, improved by swapping two levels within a column. A swap only moves two points
+# along one axis, so the criterion is updated incrementally instead of being recomputed from scratch:
+#   maximin     : the phi_p criterion (sum over the pairs of points of d^-p)^(1/p), a smooth surrogate of
+#                 the smallest distance between points (p = 50). The squared distances are kept in a
+#                 samples x samples matrix, and a swap only changes the rows of its two points: O(samples).
+#   correlation : the sum of the squared correlations between the columns. The Gram matrix of the columns
+#                 is kept, and a swap only changes the row of its column: O(factors).
+# The points are put at the centers of their cells.
+
+CRITERIA = ("maximin", "correlation")
+
+
+class _PhiP:
+    """
+    Sum of the terms d^-p over the pairs of points of a design, with the squared distances and the sums of
+    the terms of every point needed to update it.
+    """
+
+    def __init__(self, levels, p=50):
+        self.exponent = -p / 2.0  # the terms are computed from squared distances
+        self.refresh(levels)
+
+    def refresh(self, levels):
+        x = levels.astype(np.float64)
+        norms = np.einsum("ij,ij->i", x, x)
+        # Exact for integer levels: every value stays far below 2^53
+        self.d2 = norms[:, np.newaxis] + norms[np.newaxis, :] - 2 * (x @ x.T)
+        np.fill_diagonal(self.d2, np.inf)
+        self.row_sums = (self.d2 ** self.exponent).sum(axis=1)
+        self.total = self.row_sums.sum() / 2
+
+    def value(self, total):
+        return max(total, 0.0) ** (-0.5 / self.exponent)
+
+    def _moved_rows(self, levels, column, a, b):
+        """
+        Squared distances of the points of rows a and b to all the points, once levels[a, column]
+        and levels[b, column] are swapped.
+        """
+        x = levels[:, column].astype(np.float64)
+        xa, xb = x[a, np.newaxis], x[b, np.newaxis]
+        # Moving a point from xa to xb along the axis changes its squared distance to every other point
+        shift = (xb - x) ** 2 - (xa - x) ** 2
+        d2_a = self.d2[a] + shift
+        d2_b = self.d2[b] - shift
+        # The distance between the two swapped points themselves is unchanged
+        candidates = np.arange(len(d2_a))
+        d2_a[candidates, b] = self.d2[a, b]
+        d2_b[candidates, a] = self.d2[a, b]
+        return d2_a, d2_b
+
+    def evaluate(self, levels, column, a, b):
+        """
+        Changes of the total for the candidate swaps of levels[a, column] with levels[b, column]
+        (a and b are arrays of rows).
+        """
+        d2_a, d2_b = self._moved_rows(levels, column, a, b)
+        delta = np.power(d2_a, self.exponent, out=d2_a).sum(axis=1) - self.row_sums[a]
+        delta += np.power(d2_b, self.exponent, out=d2_b).sum(axis=1) - self.row_sums[b]
+        return delta
+
+    def apply(self, levels, column, a, b, delta):
+        """
+        Updates the distances and the sums for the swap of levels[a, column] with levels[b, column],
+        before the levels themselves are swapped.
+        """
+        (d2_a,), (d2_b,) = self._moved_rows(levels, column, [a], [b])
+        for row, d2 in ((a, d2_a), (b, d2_b)):
+            change = d2 ** self.exponent - self.d2[row] ** self.exponent
+            self.d2[row, :] = d2
+            self.d2[:, row] = d2
+            self.row_sums += change
+            self.row_sums[row] += change.sum()
+        self.total += delta
+
+
+class _Correlation:
+    """
+    Sum of the squared correlations between the columns of a design, with the Gram matrix needed to update it.
+    """
+
+    def __init__(self, levels):
+        samples = len(levels)
+        # Every column is a permutation of 0 .. samples - 1, so their means and variances are all the same
+        self.offset = samples * ((samples - 1) / 2.0) ** 2
+        self.scale = samples * (samples ** 2 - 1) / 12.0
+        self.refresh(levels)
+
+    def refresh(self, levels):
+        x = levels.astype(np.float64)
+        self.gram = x.T @ x
+        corr = (self.gram - self.offset) / self.scale
+        self.total = (np.triu(corr, 1) ** 2).sum()
+
+    def value(self, total):
+        return max(total, 0.0)
+
+    def _moved_rows(self, levels, column, a, b):
+        """
+        Rows of the Gram matrix for the column once levels[a, column] and levels[b, column] are swapped.
+        """
+        x_a, x_b = levels[a].astype(np.float64), levels[b].astype(np.float64)
+        row = self.gram[column]
+        # Swapping the levels of rows a and b changes the dot product of the column with every other one
+        rows = row + (x_b[:, column] - x_a[:, column])[:, np.newaxis] * (x_a - x_b)
+        rows[:, column] = row[column]
+        return rows
+
+    def evaluate(self, levels, column, a, b):
+        row = self.gram[column]
+        rows = self._moved_rows(levels, column, a, b)
+        old = ((row - self.offset) / self.scale) ** 2
+        new = ((rows - self.offset) / self.scale) ** 2
+        return (new - old).sum(axis=1)
+
+    def apply(self, levels, column, a, b, delta):
+        (row,) = self._moved_rows(levels, column, [a], [b])
+        self.gram[column, :] = row
+        self.gram[:, column] = row
+        self.total += delta
+
+
+def optimized_lhs(n, samples=None, criterion="maximin", iterations=None, seed=None):
+    """
+    Latin hypercube with `samples` points in `n` dimensions, optimized by the ESE algorithm for a criterion:
+    'maximin' (spread the points apart, by phi_p) or 'correlation' (decorrelate the columns).
+    iterations is the number of outer ESE iterations, each of which tries up to 100 x 50 column swaps
+    (default: 10, a few seconds for 2000 points in 30 dimensions). seed makes the design reproducible.
+    Returns a (samples, n) matrix of cell centers in the unit hypercube.
+    """
+    if criterion not in CRITERIA:
+        raise ValueError(
+            "criterion must be one of {}, got {!r}".format(
+                ", ".join(CRITERIA), criterion
+            )
+        )
+    if samples is None:
+        samples = n
+    if iterations is None:
+        iterations = 10
+    rng = np.random.default_rng(seed)
+
+    levels = np.argsort(rng.random((samples, n)), axis=0)
+    if samples < 3 or n < 1:
+        return (levels + 0.5) / samples
+
+    state = _PhiP(levels) if criterion == "maximin" else _Correlation(levels)
+
+    # Parameters of Jin et al.: J candidate swaps per step, M steps per iteration
+    pairs = samples * (samples - 1) // 2
+    swaps = max(1, min(pairs // 5, 50))
+    steps = max(1, min(2 * pairs * n // swaps, 100))
+
+    best = levels.copy()
+    best_value = state.value(state.total)
+    refreshed_total = state.total
+    threshold = 0.005 * best_value
+
+    for _ in range(iterations):
+        previous_best = best_value
+        accepted = improved = 0
+
+        for step in range(steps):
+            column = step % n
+            a = rng.integers(samples, size=swaps)
+            b = (a + rng.integers(1, samples, size=swaps)) % samples
+            deltas = state.evaluate(levels, column, a, b)
+            j = int(np.argmin(deltas))
+
+            current = state.value(state.total)
+            if (
+                state.value(state.total + deltas[j]) - current
+                > threshold * rng.random()
+            ):
+                continue
+            state.apply(levels, column, a[j], b[j], deltas[j])
+            levels[[a[j], b[j]], column] = levels[[b[j], a[j]], column]
+            accepted += 1
+            if state.total < 1e-3 * refreshed_total:
+                # The rounding errors left by the terms that were removed now weigh on the updates
+                state.refresh(levels)
+                refreshed_total = state.total
+
+            value = state.value(state.total)
+            if value < best_value:
+                best[:] = levels
+                best_value = value
+                improved += 1
+
+        # Recomputing the criterion from scratch drops the rounding errors of the updates
+        state.refresh(levels)
+        refreshed_total = state.total
+
+        # Threshold control: lower it while the search improves, raise it to escape local optima
+        accept_ratio, improve_ratio = accepted / steps, improved / steps
+        if best_value < previous_best:
+            if accept_ratio > 0.1 and improve_ratio < accept_ratio:
+                threshold *= 0.8
+            elif not (accept_ratio > 0.1 and improve_ratio == accept_ratio):
+                threshold /= 0.8
+        elif accept_ratio < 0.1:
+            threshold /= 0.7
+        elif accept_ratio > 0.8:
+            threshold *= 0.9
+
+    return (best + 0.5) / samples
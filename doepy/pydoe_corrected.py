@@ -1,14 +1,11 @@
-import re
 import numpy as np
 from itertools import dropwhile, combinations, islice
-import string
-from scipy.special import binom
 
 
 # __all__ = ['np', 'fullfact_corrected', 'ff2n_corrected', 'fracfact']
 
 
-def fullfact_corrected(levels):
+def fullfact_corrected(levels, integer=False):
     """
     Create a general full-factorial design
     
@@ -18,6 +15,12 @@ def fullfact_corrected(levels):
         An array of integers that indicate the number of levels of each input
         design factor.
     
+    Optional
+    --------
+    integer : bool
+        If True, the coded levels are returned in the smallest unsigned
+        integer dtype able to hold them instead of float64 (default = False).
+    
     Returns
     -------
     mat : 2d-array
@@ -54,20 +57,27 @@ def fullfact_corrected(levels):
                [ 1.,  3.,  2.]])
                
     """
+    levels = [int(lvl) for lvl in levels]
     n = len(levels)  # number of factors
-    nb_lines = np.prod(levels)  # number of trial conditions
-    H = np.zeros((nb_lines, n))
+    nb_lines = int(np.prod(levels, dtype=np.int64))  # number of trial conditions
 
+    if integer:
+        dtype = np.min_scalar_type(max(levels + [1]) - 1)
+    else:
+        dtype = np.float64
+    H = np.empty((nb_lines, n), dtype=dtype)
+
+    # Column i cycles through its levels, each one repeated level_repeat times,
+    # and the whole cycle is repeated range_repeat times. Viewing the (contiguous)
+    # design as (range_repeat, levels[i], level_repeat, n) lets every column be
+    # written straight into H by broadcasting the level codes.
     level_repeat = 1
-    range_repeat = np.prod(levels)
+    range_repeat = nb_lines
     for i in range(n):
         range_repeat //= levels[i]
-        lvl = []
-        for j in range(levels[i]):
-            lvl += [j] * level_repeat
-        rng = lvl * range_repeat
+        view = H.reshape(range_repeat, levels[i], level_repeat, n)
+        view[:, :, :, i] = np.arange(levels[i], dtype=dtype)[:, np.newaxis]
         level_repeat *= levels[i]
-        H[:, i] = rng
 
     return H
 
@@ -185,67 +195,120 @@ def fracfact_corrected(gen):
                [-1.,  1.,  1.,  1., -1.],
                [ 1.,  1., -1.,  1.,  1.]])
        
+
+    The string is only parsed into bitmasks here, the design itself is
+    computed by ``fracfact_from_masks``, which has no limit of 26 letters.
     """
-    # Recognize letters and combinations
-    A = [item for item in re.split("\-|\s|\+", gen) if item]  # remove empty strings
-    C = [len(item) for item in A]
+    n_base, masks, signs = _parse_generator(gen)
+    return fracfact_from_masks(n_base, masks, signs)
 
-    # Indices of single letters (main factors)
-    I = [i for i, item in enumerate(C) if item == 1]
 
-    # Indices of letter combinations (we need them to fill out H2 properly).
-    J = [i for i, item in enumerate(C) if item != 1]
+def _parse_generator(gen):
+    """
+    Translate a generator string like "a b -ab c" into the number of main
+    factors, the bitmask of every column (bit i set for the i-th letter of the
+    alphabet) and the sign of every column.
+    """
+    items = [item for item in gen.split() if item.strip("+-")]
+
+    masks = []
+    signs = []
+    n_base = 0
+    for item in items:
+        signs.append(-1 if item.startswith("-") else 1)
+        letters = item.strip("+-").lower()
+        if len(letters) == 1:
+            # Main factors take the columns of the full factorial in order
+            masks.append(1 << n_base)
+            n_base += 1
+        else:
+            mask = 0
+            for c in letters:
+                mask |= 1 << (ord(c) - ord("a"))
+            masks.append(mask)
 
-    # Check if there are "-" or "+" operators in gen
-    U = [item for item in gen.split(" ") if item]  # remove empty strings
+    return n_base, masks, signs
 
-    # If R1 is either None or not, the result is not changed, since it is a
-    # multiplication of 1.
-    R1 = _grep(U, "+")
-    R2 = _grep(U, "-")
 
-    # Fill in design with two level factorial design
-    H1 = ff2n(len(I))
-    H = np.zeros((H1.shape[0], len(C)))
-    H[:, I] = H1
+def fracfact_from_masks(n_base, masks, signs=None):
+    """
+    Create a 2-level fractional-factorial design from integer bitmasks.
 
-    # Recognize combinations and fill in the rest of matrix H2 with the proper
-    # products
-    for k in J:
-        # For lowercase letters
-        xx = np.array([ord(c) for c in A[k]]) - 97
+    Parameters
+    ----------
+    n_base : int
+        The number of main (base) factors. The design has 2^n_base runs.
+    masks : list of int
+        One bitmask per column of the design. Bit i is set if main factor i
+        takes part in the product defining the column, so the main factors
+        themselves are 1, 2, 4, ... and e.g. 0b101 is the interaction of
+        factors 0 and 2.
 
-        # For uppercase letters
-        if np.any(xx < 0):
-            xx = np.array([ord(c) for c in A[k]]) - 65
+    Optional
+    --------
+    signs : list of int
+        +1 or -1 for every column, -1 giving the opposite of the product
+        (default: all +1).
 
-        H[:, k] = np.prod(H1[:, xx], axis=1)
+    Returns
+    -------
+    H : 2d-array
+        A 2^n_base-by-len(masks) matrix with coded levels -1 and 1.
 
-    # Update design if gen includes "-" operator
-    if R2:
-        H[:, R2] *= -1
+    Notes
+    -----
+    The runs follow ``ff2n(n_base)``, the first main factor changing fastest.
+    With the levels coded as bits (0 for -1, 1 for +1), a product of main
+    factors is +1 exactly when the number of its factors at the low level is
+    even. That number is the popcount of the mask minus the count of its bits
+    set in the run, and the counts of all the columns are obtained at once as
+    a single matrix product of the run bits with the mask bits.
 
-    # Return the fractional factorial design
-    return H
+    Example
+    -------
+    ::
 
+        >>> fracfact_from_masks(2, [0b01, 0b10, 0b11], [1, 1, -1])
+        array([[-1., -1., -1.],
+               [ 1., -1.,  1.],
+               [-1.,  1.,  1.],
+               [ 1.,  1., -1.]])
 
-def _grep(haystack, needle):
-    try:
-        haystack[0]
-    except (TypeError, AttributeError):
-        return [0] if needle in haystack else []
-    else:
-        locs = []
-        for idx, item in enumerate(haystack):
-            if needle in item:
-                locs += [idx]
-        return locs
+    which is the design of ``fracfact_corrected("a b -ab")``.
+    """
+    n_base = int(n_base)
+    masks = [int(mask) for mask in masks]
+    if signs is None:
+        signs = [1] * len(masks)
+    if len(signs) != len(masks):
+        raise ValueError("one sign is needed for every mask")
+    for mask in masks:
+        if not 0 < mask < (1 << n_base):
+            raise ValueError(
+                "mask {} does not select any of the {} base factors only".format(
+                    mask, n_base
+                )
+            )
+
+    # Bit i of run r is the level (0 or 1) of main factor i
+    bits = fullfact_corrected([2] * n_base, integer=True).astype(np.float32)
+    mask_bits = np.array(
+        [[(mask >> i) & 1 for mask in masks] for i in range(n_base)], dtype=np.float32
+    ).reshape(n_base, len(masks))
+    popcounts = mask_bits.sum(axis=0)
+
+    low_count = popcounts - bits @ mask_bits
+    H = 1.0 - 2.0 * np.fmod(low_count, 2.0, dtype=np.float64)
+    H *= np.asarray(signs, dtype=np.float64)
+    return H
 
 
 def _n_fac_at_res(n, res):
     """ Calculate number of possible factors for fractional factorial
     design with `n` base factors at resolution `res`.
     """
+    from scipy.special import binom
+
     return sum(binom(n, r) for r in range(res - 1, n)) + n
 
 
@@ -308,6 +371,14 @@ def fracfact_by_res(n, res):
         ...
         ValueError: design not possible
     """
+    return fracfact_from_masks(*masks_by_res(n, res))
+
+
+def masks_by_res(n, res):
+    """
+    Number of base factors and the bitmasks of the `n` columns of the
+    fractional factorial design built by ``fracfact_by_res(n, res)``.
+    """
     # Determine minimum required number of base-factors.
     min_fac = next(
         dropwhile(lambda n_: _n_fac_at_res(n_, res) < n, range(res - 1, n)), None
@@ -315,30 +386,70 @@ def fracfact_by_res(n, res):
 
     if min_fac is None:
         raise ValueError("design not possible")
-    elif min_fac > len(string.ascii_lowercase):
-        # This check needs to be done to make sure that the number
-        # of available are enough since `fracfact` parses design generator
-        # characters. In practice, this is highly theoretical and it is
-        # much more likely to run into memory-issues.
-        raise ValueError("design requires too many base-factors.")
-
-    # Get base factors.
-    factors = list(string.ascii_lowercase[:min_fac])
 
-    # Fill out with factor combinations until `n` factors.
+    # Base factors are single bits, the extra factors are their combinations
+    # with at least res - 1 members, until there are `n` factors.
+    factors = [1 << i for i in range(min_fac)]
     factor_combs = (
-        "".join(c)
-        for r in range(res - 1, len(factors))
-        for c in combinations(factors, r)
+        sum(factors[i] for i in c)
+        for r in range(res - 1, min_fac)
+        for c in combinations(range(min_fac), r)
     )
-    extra_factors = list(islice(factor_combs, n - len(factors)))
+    extra_factors = list(islice(factor_combs, n - min_fac))
 
-    # Concatenate `gen` string for `fracfact`.
-    gen = " ".join(factors + extra_factors)
-    return fracfact_corrected(gen)
+    if res == 2:
+        # The combinations of one base factor come first. The string generators of the original
+        # implementation ('a b a') made every single letter a new main factor, and so does this,
+        # keeping the designs of resolution 2 the same (full factorials).
+        singles = [mask for mask in extra_factors if not mask & (mask - 1)]
+        min_fac += len(singles)
+        factors = [1 << i for i in range(min_fac)]
+        extra_factors = extra_factors[len(singles) :]
 
+    return min_fac, factors + extra_factors
 
-def bbdesign_corrected(n, center=None):
+
+def _cyclic_blocks(n, base_blocks):
+    """
+    Blocks of a cyclic block design: every base block shifted by 0 to n - 1 modulo `n`,
+    without repeating the blocks of a short orbit.
+    """
+    blocks = {
+        tuple(sorted((b + shift) % n for b in base))
+        for base in base_blocks
+        for shift in range(n)
+    }
+    return sorted(blocks)
+
+
+# Balanced incomplete block designs with blocks of 3 factors, where every pair of factors
+# is in exactly one block (Steiner triple systems), plus the six-factor design of Box and
+# Behnken (1960), where every pair is in one or two blocks. Each block carries a 2^3 factorial,
+# so these designs need 8 * len(blocks) runs instead of the 2n(n - 1) runs of all the pairs:
+# 4n(n - 1)/3 for the Steiner triple systems, and 48 instead of 60 for the six-factor design.
+BIBD_BLOCKS = {
+    6: [(0, 1, 3), (1, 2, 4), (2, 3, 5), (0, 3, 4), (1, 4, 5), (0, 2, 5)],
+    7: _cyclic_blocks(7, [(0, 1, 3)]),
+    9: [
+        (0, 1, 2),
+        (3, 4, 5),
+        (6, 7, 8),
+        (0, 3, 6),
+        (1, 4, 7),
+        (2, 5, 8),
+        (0, 4, 8),
+        (1, 5, 6),
+        (2, 3, 7),
+        (0, 5, 7),
+        (1, 3, 8),
+        (2, 4, 6),
+    ],
+    13: _cyclic_blocks(13, [(0, 1, 4), (0, 2, 8)]),
+    15: _cyclic_blocks(15, [(0, 1, 4), (0, 2, 9), (0, 5, 10)]),
+}
+
+
+def bbdesign_corrected(n, center=None, blocks=None):
     """
     Create a Box-Behnken design
     
@@ -351,6 +462,13 @@ def bbdesign_corrected(n, center=None):
     --------
     center : int
         The number of center points to include (default = 1).
+    blocks : str or 2d array-like
+        The groups of factors varied together. By default, every pair of
+        factors gets a 2^2 factorial with the other factors at their center.
+        'bibd' uses the balanced incomplete block design of BIBD_BLOCKS for
+        `n` (6, 7, 9, 13 or 15 factors), which needs fewer runs. Any list of
+        blocks of equal size (0-based factor indices) is also accepted, as
+        long as every pair of factors is in at least one block.
     
     Returns
     -------
@@ -381,26 +499,33 @@ def bbdesign_corrected(n, center=None):
     """
     assert n >= 3, "Number of variables must be at least 3"
 
-    # First, compute a factorial DOE with 2 parameters
-    H_fact = ff2n_corrected(2)
-    # Now we populate the real DOE with this DOE
-
-    # We made a factorial design on each pair of dimensions
-    # - So, we created a factorial design with two factors
-    # - Make two loops
-    Index = 0
-    nb_lines = int((0.5 * n * (n - 1)) * H_fact.shape[0])
-    H = repeat_center(n, nb_lines)
-
-    for i in range(n - 1):
-        for j in range(i + 1, n):
-            Index = Index + 1
-            H[
-                max([0, (Index - 1) * H_fact.shape[0]]) : Index * H_fact.shape[0], i
-            ] = H_fact[:, 0]
-            H[
-                max([0, (Index - 1) * H_fact.shape[0]]) : Index * H_fact.shape[0], j
-            ] = H_fact[:, 1]
+    if blocks is None:
+        # Every pair of factors, in the order of the pair loops of pyDOE
+        blocks = np.column_stack(np.triu_indices(n, 1))
+    else:
+        if isinstance(blocks, str):
+            if blocks != "bibd":
+                raise ValueError("blocks must be None, 'bibd' or a list of blocks")
+            if n not in BIBD_BLOCKS:
+                raise ValueError(
+                    "no incomplete block design for {} factors, available for {}".format(
+                        n, sorted(BIBD_BLOCKS)
+                    )
+                )
+            blocks = BIBD_BLOCKS[n]
+        blocks = np.asarray(blocks, dtype=np.intp)
+        if blocks.ndim != 2 or blocks.min() < 0 or blocks.max() >= n:
+            raise ValueError(
+                "blocks must be lists of equal size of factor indices 0 to {}".format(
+                    n - 1
+                )
+            )
+        together = np.zeros((n, n), dtype=bool)
+        together[blocks[:, :, None], blocks[:, None, :]] = True
+        if not together.all():
+            raise ValueError(
+                "every pair of factors must be in at least one block to estimate the interactions"
+            )
 
     if center is None:
         if n <= 16:
@@ -409,17 +534,19 @@ def bbdesign_corrected(n, center=None):
         else:
             center = n
 
-    H = np.c_[H.T, repeat_center(n, center).T].T
+    # A 2-level factorial on the factors of each block, the others at their center.
+    # The center points are the trailing rows of zeros of the preallocated matrix.
+    H_fact = ff2n_corrected(blocks.shape[1])
+    n_blocks, runs = len(blocks), len(H_fact)
+    H = np.zeros((n_blocks * runs + center, n))
+    rows = np.arange(n_blocks * runs).reshape(n_blocks, runs, 1)
+    H[rows, blocks[:, None, :]] = H_fact
 
     return H
 
 
-import numpy as np
-
 # from pyDOE.doe_factorial import ff2n
-from pyDOE.doe_star import star
-from pyDOE.doe_union import union
-from pyDOE.doe_repeat_center import repeat_center
+# star and union are imported inside ccdesign_corrected, importing pyDOE loads SciPy.
 
 __all__ = ["ccdesign"]
 
@@ -515,6 +642,9 @@ def ccdesign_corrected(n, center=(4, 4), alpha="orthogonal", face="circumscribed
         
        
     """
+    from pyDOE.doe_star import star
+    from pyDOE.doe_union import union
+
     # Check inputs
     assert isinstance(n, int) and n > 1, '"n" must be an integer greater than 1.'
     assert alpha.lower() in (
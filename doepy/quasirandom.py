@@ -0,0 +1,465 @@
+import os
+
+import numpy as np
+
+# ==========================================================================================
+# Quasirandom (low-discrepancy) sequences with random access
+# ==========================================================================================
+# Every point of these sequences is a function of its index alone, so any block of indices is computed
+# directly, as one vectorized operation: a design can be resumed from any run, split into shards that are
+# generated independently, or extended later without regenerating or storing the earlier runs.
+
+
+def first_primes(count):
+    """
+    The first `count` prime numbers, the bases of the Halton sequence.
+    """
+    if count < 1:
+        return np.zeros(0, dtype=np.int64)
+    # The n-th prime is below n (log n + log log n) for n >= 6
+    limit = 15
+    if count >= 6:
+        limit = int(count * (np.log(count) + np.log(np.log(count)))) + 1
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    for number in range(2, int(limit ** 0.5) + 1):
+        if sieve[number]:
+            sieve[number * number :: number] = False
+    return np.flatnonzero(sieve)[:count].astype(np.int64)
+
+
+def _digit_count(base, max_index):
+    """
+    Number of base-`base` digits of the largest index.
+    """
+    count = 1
+    while base ** count <= max_index:
+        count += 1
+    return count
+
+
+def radical_inverse(indices, base, permutations=None):
+    """
+    Van der Corput radical inverse of the integer indices in the given base: the digits of each index,
+    mirrored around the radix point, for a whole array of indices at once.
+    permutations is an optional (digits, base) array: digit k of every index is replaced by
+    permutations[k][digit] before being mirrored. The digits are then taken up to that number of
+    positions, leading zeros included, which is what scrambling needs.
+    """
+    remaining = np.array(indices, dtype=np.int64)
+    max_index = int(remaining.max(initial=0))
+    if max_index < 2 ** 32:
+        remaining = remaining.astype(np.uint32)  # faster integer division
+    result = np.zeros(remaining.shape)
+    digits = _digit_count(base, max_index)
+    if permutations is not None:
+        digits = min(digits, len(permutations))
+
+    # Same floating-point operations as the usual digit loop (diversipy's), so the values are identical
+    factor = 1.0 / base
+    for k in range(digits):
+        remaining, digit = np.divmod(remaining, base)
+        if permutations is not None:
+            digit = permutations[k][digit]
+        result += factor * digit
+        factor /= base
+
+    if permutations is not None:
+        # The leading zeros of all the indices become the same permuted digits
+        tail = 0.0
+        for k in range(digits, len(permutations)):
+            tail += factor * permutations[k][0]
+            factor /= base
+        result += tail
+    return result
+
+
+def _scrambling_permutations(base, rng):
+    """
+    Independent random permutations of the digits 0 .. base - 1 for every digit position resolved by a double.
+    """
+    digits = int(np.ceil(53 / np.log2(base)))
+    return np.argsort(rng.random((digits, base)), axis=1)
+
+
+def halton(num_points, dimension, start=0, leap=1, scramble=False, seed=None):
+    """
+    Points start, start + leap, ..., start + (num_points - 1) * leap of the Halton sequence in `dimension`
+    dimensions, with the first `dimension` primes as bases, as a (num_points, dimension) array.
+    With the defaults (start=0, leap=1, no scrambling), the points are those of diversipy's halton.
+    start: index of the first point, e.g. 10000 to extend a design of 10000 runs, or the offset of a shard
+    leap: step between the indices of consecutive points. A prime larger than the bases (e.g. 409)
+    breaks the correlation between the dimensions of the plain sequence.
+    scramble: if True, the digits of every dimension go through random permutations (one per digit position),
+    which breaks the correlation between dimensions with large bases. seed makes the permutations
+    reproducible: the same seed gives the same scrambled sequence for every start, so shards fit together.
+    """
+    if start < 0 or leap < 1:
+        raise ValueError("start must be non-negative and leap positive")
+    indices = start + leap * np.arange(num_points, dtype=np.int64)
+    bases = first_primes(dimension)
+    rng = np.random.default_rng(seed) if scramble else None
+
+    points = np.empty((num_points, dimension))
+    for j, base in enumerate(bases):
+        base = int(base)
+        permutations = _scrambling_permutations(base, rng) if scramble else None
+        points[:, j] = radical_inverse(indices, base, permutations)
+    return points
+
+
+# ==========================================================================================
+# Sobol sequence, generated in Gray code order
+# ==========================================================================================
+# Every dimension of a Sobol sequence has direction numbers V_0, V_1, ... (SOBOL_BITS-bit fractions), and
+# point i is the XOR of the V_j for the bits j set in the Gray code i ^ (i >> 1). Consecutive Gray codes
+# differ in one bit, the lowest set bit of i, so each point is the previous one XORed with one direction
+# number per dimension. Skipping ahead to any index only needs the XOR of at most SOBOL_BITS direction numbers.
+# The primitive polynomials and initial direction numbers m_j of the first 1111 dimensions are those of
+# Joe and Kuo (2008, file new-joe-kuo-6), shipped in Data/sobol_direction_numbers.npz. They are the same as
+# SciPy's, so without scrambling the points are those of scipy.stats.qmc.Sobol.
+
+SOBOL_BITS = 32
+
+SOBOL_FILE = os.path.join(
+    os.path.dirname(__file__), "Data", "sobol_direction_numbers.npz"
+)
+
+_sobol_table = None
+
+
+def _load_sobol_table():
+    global _sobol_table
+    if _sobol_table is None:
+        with np.load(SOBOL_FILE) as f:
+            _sobol_table = f["poly"].astype(np.int64), f["m"].astype(np.uint64)
+    return _sobol_table
+
+
+def sobol_max_dimension():
+    """
+    Number of dimensions for which direction numbers are shipped.
+    """
+    return len(_load_sobol_table()[0])
+
+
+def sobol_direction_numbers(dimension):
+    """
+    (SOBOL_BITS, dimension) array of the direction numbers V_j of the first `dimension` dimensions, as integers
+    scaled by 2^SOBOL_BITS. Row j is used for bit j of the Gray code of the index.
+    """
+    polys, initial = _load_sobol_table()
+    if dimension > len(polys):
+        raise ValueError(
+            "Sobol sequences are available up to {} dimensions".format(len(polys))
+        )
+    polys = polys[:dimension]
+    degrees = np.array([int(poly).bit_length() - 1 for poly in polys], dtype=np.int64)
+
+    # m_j < 2^(j + 1), computed by the recurrence of the primitive polynomial of degree s:
+    # m_j = 2 a_1 m_(j-1) ^ 4 a_2 m_(j-2) ^ ... ^ 2^(s-1) a_(s-1) m_(j-s+1) ^ 2^s m_(j-s) ^ m_(j-s)
+    m = np.ones((dimension, SOBOL_BITS), dtype=np.uint64)
+    width = min(initial.shape[1], SOBOL_BITS)
+    m[:, :width] = np.where(
+        np.arange(width) < degrees[:, np.newaxis], initial[:dimension, :width], 1
+    )
+    for j in range(1, SOBOL_BITS):
+        rows = np.flatnonzero((degrees > 0) & (degrees <= j))
+        s = degrees[rows]
+        previous = m[rows, j - s]
+        value = previous ^ (previous << s.astype(np.uint64))
+        for k in range(1, int(s.max(initial=0))):
+            # a_k is bit s - k of the polynomial
+            selected = (k < s) & ((polys[rows] >> np.maximum(s - k, 0)) & 1 == 1)
+            value ^= np.where(selected, m[rows, j - k] << np.uint64(k), 0)
+        m[rows, j] = value
+
+    shifts = np.arange(SOBOL_BITS - 1, -1, -1, dtype=np.uint64)
+    return (m << shifts).T.astype(np.uint32)
+
+
+def _scramble_direction_numbers(directions, rng):
+    """
+    Linear matrix scrambling of Matousek: the bits of the direction numbers of every dimension are multiplied
+    (over GF(2)) by a random lower triangular matrix with a unit diagonal. The sequence stays a digital net.
+    """
+    bits, dimension = directions.shape
+    shifts = np.arange(SOBOL_BITS - 1, -1, -1, dtype=np.uint32)
+    # digits[j, d, r]: bit r of V_j in dimension d, the most significant first
+    digits = ((directions[:, :, np.newaxis] >> shifts) & 1).astype(np.int32)
+    lower = np.tril(rng.integers(0, 2, size=(dimension, SOBOL_BITS, SOBOL_BITS)), -1)
+    lower[:, np.arange(SOBOL_BITS), np.arange(SOBOL_BITS)] = 1
+    scrambled = np.einsum("drc,jdc->jdr", lower.astype(np.int32), digits) & 1
+    return (scrambled.astype(np.uint32) << shifts).sum(axis=2, dtype=np.uint32)
+
+
+def sobol_generator(dimension, scramble=False, seed=None):
+    """
+    Direction numbers and digital shift of a Sobol sequence in `dimension` dimensions, the state taken by
+    sobol_points. With scramble=True, the direction numbers are scrambled and the points are XORed with a
+    random shift, both drawn from seed.
+    """
+    directions = sobol_direction_numbers(dimension)
+    shift = np.zeros(dimension, dtype=np.uint32)
+    if scramble:
+        rng = np.random.default_rng(seed)
+        directions = _scramble_direction_numbers(directions, rng)
+        shift = rng.integers(0, 2 ** SOBOL_BITS, size=dimension, dtype=np.uint32)
+    return directions, shift
+
+
+def _gray_code_points(directions, indices):
+    """
+    XOR of the direction numbers of the bits of the Gray codes of the indices, one bit at a time.
+    """
+    gray = indices ^ (indices >> 1)
+    x = np.zeros((len(indices), directions.shape[1]), dtype=np.uint32)
+    for j in range(int(gray.max(initial=0)).bit_length()):
+        selected = (gray >> j) & 1 == 1
+        x[selected] ^= directions[j]
+    return x
+
+
+def sobol_points(generator, num_points, start=0):
+    """
+    Points start to start + num_points - 1 of the Sobol sequence of a sobol_generator,
+    as a (num_points, dimension) array.
+    """
+    directions, shift = generator
+    dimension = len(shift)
+    if start < 0 or start + num_points > 2 ** SOBOL_BITS:
+        raise ValueError("Sobol indices must lie between 0 and 2^{}".format(SOBOL_BITS))
+    if num_points <= 0:
+        return np.empty((0, dimension))
+
+    # An index i = hi * 2^b + lo has the Gray code gray(hi) * 2^b ^ (hi & 1) * 2^(b - 1) ^ gray(lo),
+    # so point i is a point of block hi XORed with point lo of the first block: one XOR per dimension.
+    # Blocks of about 2^17 values are XORed and scaled at a time, which keeps them in the cache.
+    b = int(np.clip(np.log2(2 ** 17 / dimension), 1, SOBOL_BITS))
+    block_size = 1 << b
+    first_block, last_block = start >> b, (start + num_points - 1) >> b
+
+    # Points of the first block, in Gray code order: each one is the previous one XORed with
+    # the direction numbers of the lowest set bit of its index
+    steps = np.arange(1, min(block_size, start + num_points), dtype=np.int64)
+    low_points = np.empty((len(steps) + 1, dimension), dtype=np.uint32)
+    low_points[0] = 0
+    low_points[1:] = directions[np.log2(steps & -steps).astype(np.intp)]
+    np.bitwise_xor.accumulate(low_points, axis=0, out=low_points)
+
+    # Skip ahead to every block, the digital shift included
+    blocks = np.arange(first_block, last_block + 1, dtype=np.int64)
+    block_points = _gray_code_points(directions[b:], blocks) ^ shift
+    block_points[blocks & 1 == 1] ^= directions[b - 1]
+
+    out = np.empty((num_points, dimension))
+    scale = 2.0 ** -SOBOL_BITS
+    for block, block_point in zip(blocks, block_points):
+        lo = max(start - (block << b), 0)
+        hi = min(start + num_points - (block << b), block_size)
+        row = (block << b) + lo - start
+        np.multiply(
+            low_points[lo:hi] ^ block_point, scale, out=out[row : row + hi - lo]
+        )
+    return out
+
+
+def sobol(num_points, dimension, start=0, scramble=False, seed=None):
+    """
+    Points start, ..., start + num_points - 1 of the Sobol sequence in `dimension` dimensions
+    (up to sobol_max_dimension()), as a (num_points, dimension) array.
+    The sequence is most balanced over blocks of 2^m points, so powers of 2 are the best sample sizes.
+    scramble: if True, linear matrix scrambling plus a random digital shift, which removes the points
+    on the boundary and the regular patterns of the plain sequence while keeping its balance.
+    seed makes the scrambling reproducible: the same seed gives the same sequence for every start.
+    """
+    return sobol_points(sobol_generator(dimension, scramble, seed), num_points, start)
+
+
+# ==========================================================================================
+# Rank-1 lattice rules and extensible lattice sequences
+# ==========================================================================================
+# A rank-1 lattice rule with n points and generating vector z has the points frac(i * z / n), i = 0 .. n - 1:
+# one multiplication per coordinate, the cheapest low-discrepancy points there are. The shipped vector z
+# (Data/lattice_generating_vector.npz) is extensible in base 2: point i is frac(phi_2(i) * z), where phi_2 is
+# the radical inverse in base 2, so the first 2^m points are the lattice rule with 2^m points and z mod 2^m,
+# for every m. Designs of any size can be resumed at any run, and powers of 2 are the best sample sizes.
+#
+# The vector is built component by component (CBC): each coordinate is chosen, the previous ones fixed,
+# to minimize the worst-case error P_2 of the rules with 2^LATTICE_MIN_BITS to 2^LATTICE_BITS points (the
+# largest ratio of each error to the smallest one among the candidates, as in the embedded lattice rules of
+# Cools, Kuo and Nuyens, 2006). The odd numbers mod 2^m are +/- 5^b, and the kernel of P_2 is symmetric, so
+# the errors of all the candidates z = 5^b form circular correlations, computed by FFT for every level.
+
+LATTICE_BITS = 20
+
+LATTICE_MIN_BITS = 4
+
+LATTICE_FILE = os.path.join(
+    os.path.dirname(__file__), "Data", "lattice_generating_vector.npz"
+)
+
+_lattice_vector = None
+
+
+def _korobov_kernel(x):
+    """
+    Kernel of the P_2 criterion, 2 pi^2 B_2(x) with the Bernoulli polynomial B_2(x) = x^2 - x + 1/6.
+    """
+    return 2 * np.pi ** 2 * (x * x - x + 1.0 / 6)
+
+
+def construct_lattice_vector(
+    dimension, bits=LATTICE_BITS, min_bits=LATTICE_MIN_BITS, weights=None
+):
+    """
+    Generating vector of an extensible lattice sequence in base 2, by the fast CBC construction described above.
+    bits: log2 of the largest number of points the vector is optimized for
+    min_bits: log2 of the smallest one
+    weights: importance of the coordinates in P_2 (default: 0.05 for every coordinate, which suits designs
+    where all the factors matter alike)
+    """
+    n = 1 << bits
+    if weights is None:
+        weights = np.full(dimension, 0.05)
+    k = np.arange(n, dtype=np.int64)
+
+    # Candidates z = 5^b mod n, for b = 0 .. n / 4 - 1
+    candidate_count = max(n >> 2, 1)
+    candidates = np.empty(candidate_count, dtype=np.int64)
+    value = 1
+    for b in range(candidate_count):
+        candidates[b] = value
+        value = value * 5 % n
+
+    # Kernel of every modulus 2^r >= 8 at its units 5^a, in the Fourier domain
+    kernels = {}
+    for r in range(3, bits + 1):
+        units = candidates[: 1 << (r - 2)] % (1 << r)
+        kernels[r] = units, np.fft.rfft(_korobov_kernel(units / (1 << r)))
+
+    # products[k]: product over the chosen coordinates of 1 + weight * kernel(k z / n)
+    products = np.ones(n)
+    vector = np.empty(dimension, dtype=np.int64)
+    for j in range(dimension):
+        weight = weights[j]
+        # sums[b]: sum of the products over the points of the current level, with the candidate 5^b added
+        sums = np.full(
+            candidate_count, products[0] * (1 + weight * _korobov_kernel(0.0))
+        )
+        worst = np.zeros(candidate_count)
+        # Points k = 2^t u (u odd) belong to the levels with 2^(bits - t) points and more
+        for t in range(bits - 1, -1, -1):
+            r = bits - t
+            if r >= 3:
+                units, kernel = kernels[r]
+                q = products[units << t] + products[((1 << r) - units) << t]
+                correlation = np.fft.irfft(
+                    np.conj(np.fft.rfft(q)) * kernel, n=len(units)
+                )
+                sums += np.tile(
+                    q.sum() + weight * correlation, candidate_count // len(units)
+                )
+            elif r == 2:
+                q = products[1 << t] + products[3 << t]
+                sums += q * (1 + weight * _korobov_kernel(0.25))
+            else:
+                sums += products[1 << t] * (1 + weight * _korobov_kernel(0.5))
+            if r >= min_bits:
+                error = sums / (1 << r) - 1
+                np.maximum(worst, error / error.min(), out=worst)
+        z = int(candidates[np.argmin(worst)])
+        vector[j] = z
+        products *= 1 + weight * _korobov_kernel((k * z % n) / n)
+    return vector
+
+
+def build_lattice_table(dimension=1111, filename=LATTICE_FILE):
+    """
+    Constructs the generating vector for 2^LATTICE_MIN_BITS to 2^LATTICE_BITS points in `dimension` dimensions
+    and saves it as the file read by lattice (a few minutes for the default 1111 dimensions).
+    """
+    vector = construct_lattice_vector(dimension)
+    np.savez_compressed(filename, z=vector.astype(np.uint32), bits=LATTICE_BITS)
+
+
+def lattice_generating_vector(dimension):
+    """
+    First `dimension` coordinates of the shipped generating vector.
+    """
+    global _lattice_vector
+    if _lattice_vector is None:
+        with np.load(LATTICE_FILE) as f:
+            _lattice_vector = f["z"].astype(np.int64)
+    if dimension > len(_lattice_vector):
+        raise ValueError(
+            "lattice designs are available up to {} dimensions, pass a generating_vector beyond".format(
+                len(_lattice_vector)
+            )
+        )
+    return _lattice_vector[:dimension]
+
+
+def _bit_reversal(indices):
+    """
+    The 32 bits of the indices in reverse order, phi_2(i) * 2^32.
+    """
+    x = np.array(indices, dtype=np.uint64)
+    for shift, mask in (
+        (1, 0x55555555),
+        (2, 0x33333333),
+        (4, 0x0F0F0F0F),
+        (8, 0x00FF00FF),
+        (16, 0x0000FFFF),
+    ):
+        shift, mask = np.uint64(shift), np.uint64(mask)
+        x = ((x >> shift) & mask) | ((x & mask) << shift)
+    return x
+
+
+def lattice(
+    num_points,
+    dimension,
+    generating_vector=None,
+    start=0,
+    shift=False,
+    seed=None,
+    size=None,
+):
+    """
+    Points start, ..., start + num_points - 1 of a rank-1 lattice in `dimension` dimensions, as a
+    (num_points, dimension) array. Every point is computed from its index alone.
+    generating_vector: None for the shipped extensible vector (up to 1111 dimensions), whose first 2^m points
+    are a lattice rule for every m. Otherwise the vector z of the rule frac(i * z / size) with `size` points
+    (default: start + num_points).
+    shift: if True, every coordinate is shifted by a random amount modulo 1 (drawn from seed), which makes
+    the points an unbiased sample. Independent shifts (different seeds) give replicates of the design.
+    """
+    if start < 0 or start + num_points > 2 ** 32:
+        raise ValueError("lattice indices must lie between 0 and 2^32")
+    indices = np.arange(start, start + num_points, dtype=np.int64)
+
+    if generating_vector is None:
+        z = lattice_generating_vector(dimension)
+        # phi_2(i) has at most 32 bits and z at most LATTICE_BITS, so the products are exact
+        x = (_bit_reversal(indices) * 2.0 ** -32)[:, np.newaxis] * z
+    else:
+        z = np.asarray(generating_vector, dtype=np.int64)
+        if z.shape != (dimension,):
+            raise ValueError(
+                "generating_vector must have {} components, got {}".format(
+                    dimension, len(z)
+                )
+            )
+        if size is None:
+            size = start + num_points
+        if not 0 < size <= 2 ** 31:
+            raise ValueError("size must lie between 1 and 2^31")
+        # Both factors are below 2^31, so the products are exact in int64
+        x = ((indices % size)[:, np.newaxis] * (z % size) % size) / size
+    x -= np.floor(x)
+
+    if shift:
+        x += np.random.default_rng(seed).random(dimension)
+        x -= np.floor(x)
+    return x
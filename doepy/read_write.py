@@ -1,4 +1,10 @@
 import csv
+import json
+import os
+import struct
+
+import numpy as np
+import pandas as pd
 
 # ==========================================================
 # Function for reading a CSV file into a dictionary format
@@ -11,26 +17,34 @@ def read_variables_csv(csvfile):
     Helper function to read a CSV file on the disk, where user stores the limits/ranges of the process variables.
     Output of this function can be used directly with any DOE builder function
     The CSV file should be in the same directory
+
+    The file is parsed in a single pass, every row once, appending each cell to the level list of its column.
+    Factors may have different numbers of levels: blank cells at the bottom of a shorter column are skipped.
+    Raises an OSError if the file cannot be opened and a ValueError if a cell is not a number.
     """
-    dict_key = {}
-    try:
-        with open(csvfile) as f:
-            reader = csv.DictReader(f)
-            fields = reader.fieldnames
-            for field in fields:
-                lst = []
-                with open(csvfile) as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        lst.append(float(row[field]))
-                dict_key[field] = lst
-
-        return dict_key
-    except:
-        print(
-            "Error in reading the specified file from the disk. Please make sure it is in current directory."
-        )
-        return -1
+    with open(csvfile, newline="") as f:
+        reader = csv.reader(f)
+        try:
+            fields = next(reader)
+        except StopIteration:
+            raise ValueError("{} is empty, expected a header row".format(csvfile))
+
+        columns = [[] for _ in fields]
+        for row in reader:
+            for field, column, cell in zip(fields, columns, row):
+                cell = cell.strip()
+                if not cell:
+                    continue
+                try:
+                    column.append(float(cell))
+                except ValueError:
+                    raise ValueError(
+                        "Could not read {!r} as a number in column {!r}, line {} of {}".format(
+                            cell, field, reader.line_num, csvfile
+                        )
+                    ) from None
+
+    return dict(zip(fields, columns))
 
 
 # ===============================================================
@@ -38,17 +52,416 @@ def read_variables_csv(csvfile):
 # ===============================================================
 
 
-def write_csv(df, filename, rounding=2):
+def write_csv(
+    df, filename, rounding=2, columns=None, chunk_rows=100000, buffer_size=1048576
+):
     """
     Writes a CSV file on to the disk from the computed design matrix
+    df: Either the design DataFrame, or any iterator of DataFrame/numpy array chunks (e.g. from one of the build.iter_* functions).
     filename: To be specified by the user. Just a name is fine. .CSV extension will be added automatically.
     rounding: Number up to which decimal the output will be rounded off. Often needed for practical DOE plans.
+    columns: Column names for the header when the chunks are numpy arrays. Ignored for DataFrames, which carry their own.
+    chunk_rows: Number of rows rounded and written at a time when a whole DataFrame is passed.
+    buffer_size: Size in bytes of the buffer of the output file handle.
+
+    The design is rounded and formatted one chunk at a time, so peak memory is that of a single chunk
+    rather than a full rounded copy of the design. Numpy array chunks are rounded into a scratch buffer
+    reused from chunk to chunk, so the arrays passed in are left untouched (and may be read-only).
+    Categorical columns with float categories (output='categorical') are written as their rounded values,
+    so they give the same text as the float columns of output='values'.
     """
-    df_copy = round(df, rounding)
+    if isinstance(df, np.ndarray):
+        df = [df]
+    if isinstance(df, pd.DataFrame):
+        chunks = (
+            df.iloc[start : start + chunk_rows]
+            for start in range(0, max(len(df), 1), chunk_rows)
+        )
+    else:
+        chunks = df
+
+    if ".csv" not in filename:
+        filename = filename + ".csv"
     try:
-        if ".csv" not in filename:
-            filename = filename + ".csv"
-        f = df_copy.to_csv(filename, index=False)
-        return f
-    except:
+        with open(filename, "w", newline="", buffering=buffer_size) as f:
+            header = True
+            scratch = None
+            for chunk in chunks:
+                if isinstance(chunk, pd.DataFrame):
+                    chunk = _round_frame(chunk, rounding)
+                else:
+                    chunk = np.asarray(chunk)
+                    if chunk.dtype.kind == "f":
+                        if (
+                            scratch is None
+                            or scratch.shape != chunk.shape
+                            or scratch.dtype != chunk.dtype
+                        ):
+                            scratch = np.empty_like(chunk)
+                        chunk = np.round(chunk, rounding, out=scratch)
+                    chunk = pd.DataFrame(data=chunk, columns=columns, copy=False)
+                chunk.to_csv(f, header=header, index=False)
+                header = False
+    except OSError:
         return -1
+
+
+def _round_frame(chunk, rounding):
+    """
+    Rounds the float columns of a DataFrame chunk, and the Categorical columns with float categories,
+    which DataFrame.round leaves as they are. The latter are expanded to their rounded values.
+    """
+    chunk = chunk.round(rounding)
+    for j, dtype in enumerate(chunk.dtypes):
+        if (
+            isinstance(dtype, pd.CategoricalDtype)
+            and dtype.categories.dtype.kind == "f"
+        ):
+            values = np.asarray(chunk.iloc[:, j], dtype=dtype.categories.dtype)
+            chunk.isetitem(j, np.round(values, rounding))
+    return chunk
+
+
+# ======================================================================================
+# Functions for writing and reading the design matrix in binary (.npy/.npz) form
+# ======================================================================================
+
+
+def _design_chunks(df, columns=None):
+    """
+    Normalizes a design given as a DataFrame, a numpy array or an iterator of DataFrame/array chunks
+    into an iterator of numpy arrays, plus the column names (taken from the first DataFrame if not given).
+    Raises a ValueError for chunks that are not numeric (e.g. categorical or object columns), which
+    would otherwise be written as object pointers that cannot be read back.
+    """
+    if isinstance(df, (pd.DataFrame, np.ndarray)):
+        df = [df]
+    chunks = iter(df)
+
+    try:
+        first = next(chunks)
+    except StopIteration:
+        return iter(()), columns
+    if columns is None and isinstance(first, pd.DataFrame):
+        columns = list(first.columns)
+    # Checked before any file is opened
+    first = _numeric_chunk(first)
+
+    def arrays():
+        yield first
+        for chunk in chunks:
+            yield _numeric_chunk(chunk)
+
+    return arrays(), columns
+
+
+def _numeric_chunk(chunk):
+    """
+    The chunk as a numpy array, checked to be numeric.
+    """
+    chunk = np.asarray(chunk)
+    if chunk.dtype.kind not in "biuf":
+        raise ValueError(
+            "Only numeric designs can be written in binary form, got {} columns. "
+            "Build categorical designs with output='codes' to store their level indices.".format(
+                chunk.dtype
+            )
+        )
+    return chunk
+
+
+def _npy_header(dtype, shape, length=None):
+    """
+    Header of a .npy file (format version 1.0), padded with spaces to the given total length in bytes.
+    By default it is padded to the next multiple of 64 bytes, as numpy does.
+    """
+    header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+        np.lib.format.dtype_to_descr(dtype),
+        tuple(shape),
+    )
+    # 6 bytes magic string, 2 bytes version, 2 bytes header length, then the header ending with a newline
+    if length is None:
+        length = -(-(10 + len(header) + 1) // 64) * 64
+    header = header + " " * (length - 10 - len(header) - 1) + "\n"
+    return (
+        b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+    )
+
+
+def _metadata_filename(filename):
+    """
+    Name of the JSON file holding the column names and metadata stored next to a .npy design file.
+    """
+    return os.path.splitext(filename)[0] + ".json"
+
+
+def write_npy(df, filename, columns=None, metadata=None):
+    """
+    Writes the design matrix as a raw .npy file, which any process can memory-map with read_design(filename, mmap_mode='r').
+    df: Either the design DataFrame or numpy array, or any iterator of DataFrame/numpy array chunks (e.g. from one of the build.iter_* functions).
+    filename: To be specified by the user. .npy extension will be added automatically.
+    columns: Column (factor) names. Taken from the DataFrame if not given.
+    metadata: Optional JSON-serializable dictionary, e.g. the factor level ranges used to build the design.
+
+    The column names and metadata are stored in a small JSON file next to the .npy file (same name, .json extension).
+    Chunks are written as they come, with the final number of rows patched into the header at the end,
+    so peak memory is one chunk. All chunks are cast to the dtype of the first one.
+    """
+    if not filename.endswith(".npy"):
+        filename = filename + ".npy"
+    chunks, columns = _design_chunks(df, columns)
+
+    num_rows = 0
+    dtype = None
+    with open(filename, "wb") as f:
+        for chunk in chunks:
+            if chunk.ndim == 1:
+                chunk = chunk.reshape(-1, 1)
+            if dtype is None:
+                dtype = chunk.dtype
+                num_cols = chunk.shape[1]
+                # Reserve a header wide enough for any number of rows
+                header_length = len(_npy_header(dtype, (2 ** 63 - 1, num_cols)))
+                f.write(b" " * header_length)
+            f.write(np.ascontiguousarray(chunk, dtype=dtype).tobytes())
+            num_rows += chunk.shape[0]
+
+        if dtype is None:
+            dtype = np.dtype("float64")
+            num_cols = len(columns) if columns is not None else 0
+            header_length = None
+        f.seek(0)
+        f.write(_npy_header(dtype, (num_rows, num_cols), header_length))
+
+    if columns is None:
+        columns = list(range(num_cols))
+    with open(_metadata_filename(filename), "w") as f:
+        json.dump({"columns": [str(c) for c in columns], "metadata": metadata or {}}, f)
+
+
+def write_npz(df, filename, columns=None, metadata=None, compressed=True):
+    """
+    Writes the design matrix, column names and metadata into a single (by default compressed) .npz archive.
+    df: Either the design DataFrame or numpy array, or any iterator of DataFrame/numpy array chunks.
+    filename: To be specified by the user. .npz extension will be added automatically.
+    columns: Column (factor) names. Taken from the DataFrame if not given.
+    metadata: Optional JSON-serializable dictionary, e.g. the factor level ranges used to build the design.
+
+    An .npz archive is the most compact single-file form, but it cannot be memory-mapped and chunks are joined
+    in memory before writing. Use write_npy for designs that workers should memory-map.
+    """
+    if not filename.endswith(".npz"):
+        filename = filename + ".npz"
+    chunks, columns = _design_chunks(df, columns)
+    chunks = [chunk.reshape(-1, 1) if chunk.ndim == 1 else chunk for chunk in chunks]
+    design = np.concatenate(chunks) if chunks else np.empty((0, 0))
+    if columns is None:
+        columns = list(range(design.shape[1]))
+
+    save = np.savez_compressed if compressed else np.savez
+    save(
+        filename,
+        design=design,
+        columns=np.array([str(c) for c in columns]),
+        metadata=np.array(json.dumps(metadata or {})),
+    )
+
+
+def read_design(filename, mmap_mode=None, as_frame=True):
+    """
+    Reads a design written by write_npy, write_npz, write_parquet or write_feather (picked from the file extension).
+    mmap_mode: For .npy files, memory-maps the design instead of loading it ('r' for read-only, 'c' for copy-on-write, see numpy.load).
+               Workers sharing one design file can then slice out their own rows without copying the whole matrix.
+               Feather files are memory-mapped for any mode other than None.
+    as_frame: If True (default), returns a DataFrame wrapping the design without copying it, with the metadata in df.attrs['metadata'].
+              If False, returns a tuple (design array, dictionary with the 'columns' and 'metadata').
+    """
+    if filename.endswith((".parquet", ".feather", ".arrow")):
+        df = _read_arrow_design(filename, memory_map=mmap_mode is not None)
+        if not as_frame:
+            return (
+                df.to_numpy(),
+                {"columns": list(df.columns), "metadata": df.attrs["metadata"]},
+            )
+        return df
+
+    if filename.endswith(".npz"):
+        if mmap_mode is not None:
+            raise ValueError(
+                "An .npz archive cannot be memory-mapped, write the design with write_npy instead"
+            )
+        with np.load(filename) as archive:
+            design = archive["design"]
+            info = {
+                "columns": archive["columns"].tolist(),
+                "metadata": json.loads(archive["metadata"].item()),
+            }
+    else:
+        if not filename.endswith(".npy"):
+            filename = filename + ".npy"
+        design = np.load(filename, mmap_mode=mmap_mode)
+        with open(_metadata_filename(filename)) as f:
+            info = json.load(f)
+
+    if not as_frame:
+        return design, info
+    df = pd.DataFrame(data=design, columns=info["columns"], copy=False)
+    df.attrs["metadata"] = info["metadata"]
+    return df
+
+
+# ==================================================================================================
+# Functions for writing the design in columnar Parquet/Feather (Arrow IPC) form (requires pyarrow)
+# ==================================================================================================
+
+_ARROW_METADATA_KEY = b"doepy"
+
+
+def design_metadata(design, factor_level_ranges, **parameters):
+    """
+    Builds the metadata dictionary describing how a design was built, for the metadata argument of the writers.
+    design: Name of the design, e.g. 'central_composite'.
+    factor_level_ranges: The dictionary of factor/level ranges the design was built from.
+    parameters: The other arguments of the builder, e.g. center=(2, 2), alpha='o'.
+    Example:
+    design_metadata('lhs', {'Pressure':[50,70],'Temperature':[290, 350]}, num_samples=100)
+    """
+    return {
+        "design": design,
+        "parameters": parameters,
+        "factor_ranges": {
+            str(key): list(levels) for key, levels in factor_level_ranges.items()
+        },
+    }
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Parquet and Feather output require pyarrow. Install it with: pip install pyarrow"
+        ) from None
+    return pyarrow
+
+
+def _arrow_tables(df, columns=None, rows_per_table=None):
+    """
+    Converts a design given as a DataFrame, a numpy array or an iterator of DataFrame/array chunks
+    into an iterator of Arrow tables, keeping the native dtype of every column.
+    A whole DataFrame or array is cut into tables of rows_per_table rows.
+    """
+    pa = _import_pyarrow()
+
+    if isinstance(df, (pd.DataFrame, np.ndarray)):
+        design = df
+        step = rows_per_table or max(len(design), 1)
+        df = (
+            design[start : start + step]
+            for start in range(0, max(len(design), 1), step)
+        )
+
+    for chunk in df:
+        if not isinstance(chunk, pd.DataFrame):
+            chunk = np.asarray(chunk)
+            if chunk.ndim == 1:
+                chunk = chunk.reshape(-1, 1)
+            chunk = pd.DataFrame(data=chunk, columns=columns, copy=False)
+        chunk.columns = [str(c) for c in chunk.columns]
+        yield pa.Table.from_pandas(chunk, preserve_index=False)
+
+
+def _with_design_metadata(schema, metadata):
+    """
+    Adds the JSON-encoded design metadata to the (pandas) metadata of an Arrow schema.
+    """
+    schema_metadata = dict(schema.metadata or {})
+    schema_metadata[_ARROW_METADATA_KEY] = json.dumps(metadata or {})
+    return schema.with_metadata(schema_metadata)
+
+
+def write_parquet(
+    df,
+    filename,
+    columns=None,
+    metadata=None,
+    row_group_size=100000,
+    compression="snappy",
+):
+    """
+    Writes the design as a Parquet file, storing every column with its native dtype.
+    df: Either the design DataFrame or numpy array, or any iterator of DataFrame/numpy array chunks (e.g. from one of the build.iter_* functions).
+    filename: To be specified by the user. .parquet extension will be added automatically.
+    columns: Column names when the design is given as numpy arrays. Ignored for DataFrames, which carry their own.
+    metadata: Optional JSON-serializable dictionary embedded in the schema metadata, e.g. from design_metadata().
+    row_group_size: Maximum number of rows per row group. Chunks are written as they come, so peak memory is one chunk.
+    compression: Parquet compression codec ('snappy', 'gzip', 'zstd', 'none', ...).
+    Categorical columns are read back as categorical only if their categories are strings, numeric ones come back
+    as plain columns of their values. write_feather keeps both. Requires pyarrow.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    if not filename.endswith(".parquet"):
+        filename = filename + ".parquet"
+
+    writer = None
+    try:
+        for table in _arrow_tables(df, columns, row_group_size):
+            if writer is None:
+                schema = _with_design_metadata(table.schema, metadata)
+                writer = pq.ParquetWriter(filename, schema, compression=compression)
+            writer.write_table(table.cast(schema), row_group_size=row_group_size)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_feather(df, filename, columns=None, metadata=None, compression="lz4"):
+    """
+    Writes the design as a Feather (Arrow IPC) file, storing every column with its native dtype.
+    df: Either the design DataFrame or numpy array, or any iterator of DataFrame/numpy array chunks (e.g. from one of the build.iter_* functions).
+    filename: To be specified by the user. .feather extension will be added automatically.
+    columns: Column names when the design is given as numpy arrays. Ignored for DataFrames, which carry their own.
+    metadata: Optional JSON-serializable dictionary embedded in the schema metadata, e.g. from design_metadata().
+    compression: 'lz4', 'zstd' or None. Uncompressed files can be memory-mapped by read_design.
+    Each chunk is written as one record batch, so peak memory is one chunk. Requires pyarrow.
+    """
+    pa = _import_pyarrow()
+
+    if not filename.endswith((".feather", ".arrow")):
+        filename = filename + ".feather"
+
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    writer = None
+    with pa.OSFile(filename, "wb") as sink:
+        try:
+            for table in _arrow_tables(df, columns):
+                if writer is None:
+                    schema = _with_design_metadata(table.schema, metadata)
+                    writer = pa.ipc.new_file(sink, schema, options=options)
+                writer.write_table(table.cast(schema))
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+def _read_arrow_design(filename, memory_map=False):
+    """
+    Reads a Parquet or Feather design into a DataFrame, with the embedded metadata in df.attrs['metadata'].
+    """
+    pa = _import_pyarrow()
+
+    if filename.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(filename, memory_map=memory_map)
+    else:
+        source = pa.memory_map(filename) if memory_map else pa.OSFile(filename)
+        with source:
+            table = pa.ipc.open_file(source).read_all()
+
+    metadata = (table.schema.metadata or {}).get(_ARROW_METADATA_KEY)
+    df = table.to_pandas()
+    df.attrs["metadata"] = json.loads(metadata) if metadata else {}
+    return df
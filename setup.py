@@ -17,7 +17,9 @@ setup(
     long_description_content_type='text/markdown',
     long_description=read('README.md'),
     packages=['doepy'],
+    package_data={'doepy': ['Data/*.json', 'Data/*.npz']},
     install_requires=['pyDOE', 'numpy','pandas','diversipy'],
+    extras_require={'parquet': ['pyarrow']},
     keywords=[
         'DOE',
         'science',